@@ -145,7 +145,7 @@ class ContextSnapshot:
         context.last_updated = self.last_updated
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextMemory:
     """
     Persistent context object for emergency call triage.
@@ -157,6 +157,9 @@ class ContextMemory:
     
     Maintains state across multiple conversation turns, merging partial
     information and improving over time.
+    
+    Uses __slots__ (slots=True) so field reads on the per-frame decision path
+    are slot lookups rather than instance __dict__ lookups.
     """
     session_id: str
     
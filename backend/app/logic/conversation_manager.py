@@ -28,6 +28,7 @@ from pathlib import Path
 from app.nlp.signal_extraction import extract_signals
 from app.logic.context_memory import ContextMemory, get_or_create_context
 from app.logic.urgency_scoring import calculate_urgency_score
+from app.nlp.india_keywords import detect_urgency_signals_incremental
 from app.logic.escalation import check_escalation_required, detect_explicit_human_request
 from app.ml.stress_estimator import estimate_stress
 from app.logic.explainability import explain_decision
@@ -116,10 +117,13 @@ class HybridMLConversationManager:
         self.question_count: int = 0
         self.last_question: Optional[str] = None
         self.user_input_buffer: str = ""  # Accumulated user input for context
+        # (transcript, detected) from the last urgency-signal scan of user_input_buffer
+        self._urgency_signal_cache: Optional[tuple] = None
         
         # Escalation state
         self.escalation_required: bool = False
         self.escalation_reason: Optional[str] = None
+        self.escalation_reason_id: int = 0  # EscalationReason of the rule that fired
         self.escalation_priority: Optional[str] = None
         self.escalation_message_sent: bool = False  # Track if escalation message was already sent
         
@@ -300,6 +304,7 @@ class HybridMLConversationManager:
             # Update escalation state (only if not already sent escalation message)
             self.escalation_required = escalation_result["human_required"]
             self.escalation_reason = escalation_result.get("reason")
+            self.escalation_reason_id = escalation_result.get("reason_id", 0)
             self.escalation_priority = escalation_result.get("priority")
             
             # Log escalation event if escalation was triggered
@@ -319,6 +324,7 @@ class HybridMLConversationManager:
             escalation_result = {
                 "human_required": True,
                 "reason": self.escalation_reason,
+                "reason_id": self.escalation_reason_id,
                 "priority": self.escalation_priority
             }
             # Keep escalation_required = True for incident summary, but don't check again
@@ -593,6 +599,13 @@ class HybridMLConversationManager:
             context_dict["transcript"] = self.user_input_buffer
             context_dict["user_input_buffer"] = self.user_input_buffer
             
+            # Buffer is append-only, so urgency signals only need re-scanning in the new suffix
+            previous_buffer, previous_detected = self._urgency_signal_cache or ("", False)
+            urgency_signals_detected = detect_urgency_signals_incremental(
+                self.user_input_buffer, previous_buffer, previous_detected
+            )
+            self._urgency_signal_cache = (self.user_input_buffer, urgency_signals_detected)
+            
             # Get actual intent from last signals or context
             # If we have an incident type, map it to intent
             intent = "unclear"
@@ -624,7 +637,8 @@ class HybridMLConversationManager:
                 repetition_count=self.context.repetition_count,
                 clarity_avg=self.context.clarity_avg,
                 time_elapsed_seconds=time_elapsed,
-                context=context_dict
+                context=context_dict,
+                urgency_signals_detected=urgency_signals_detected
             )
             
             # Update context with calculated urgency
@@ -699,6 +713,7 @@ class HybridMLConversationManager:
         self.user_input_buffer = ""
         self.escalation_required = False
         self.escalation_reason = None
+        self.escalation_reason_id = 0
         self.escalation_priority = None
         self.last_intent = None
         self.last_intent_confidence = 0.0
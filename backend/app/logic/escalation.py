@@ -21,6 +21,7 @@ Escalation Rules (all deterministic):
 """
 
 import logging
+from enum import IntEnum
 from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,54 @@ CRITICAL_FIELDS_MISSING_THRESHOLD = 5  # Escalate if critical fields missing aft
 CRITICAL_FIELDS = ["location", "incident_type"]
 
 
+class EscalationReason(IntEnum):
+    """Stable identifiers for the escalation rule that fired (index into the reason tables)."""
+    NONE = 0
+    URGENCY_THRESHOLD = 1
+    LOW_CLARITY = 2
+    PANIC_PERSISTENCE = 3
+    CRITICAL_FIELDS_MISSING = 4
+    IMMEDIATE_DANGER = 5
+    EXPLICIT_REQUEST = 6
+
+
+# Short reason labels, indexed by EscalationReason
+ESCALATION_REASON_TEXT = (
+    None,
+    "Urgency threshold exceeded",
+    "Low speech clarity",
+    "Persistent panic",
+    "Critical fields missing",
+    "Immediate danger detected",
+    "User explicitly requested human assistance",
+)
+
+# Detailed reason templates, indexed by EscalationReason
+# Only formatted when a rule actually fires
+_REASON_TEMPLATES = (
+    None,
+    "High urgency score (%.2f) exceeds threshold (%s)",
+    "Low clarity (%.2f) below threshold (%s)",
+    "Panic detected %d times in recent interactions (threshold: %d)",
+    "Critical fields missing (%s) after %d questions",
+    "Immediate danger detected (fire spreading, weapon, bleeding, or trapped)",
+    "User explicitly requested human assistance",
+)
+
+
+def _escalate(reason_id: EscalationReason, priority: str, *args) -> Dict[str, any]:
+    """Build the escalation decision for a fired rule and log it."""
+    template = _REASON_TEMPLATES[reason_id]
+    reason = template % args if args else template
+    logger.warning(f"Escalation triggered: {reason}")
+    return {
+        "human_required": True,
+        "reason": reason,
+        "reason_id": int(reason_id),
+        "priority": priority
+    }
+
+
 def check_escalation_required(
     urgency_score: float,
     urgency_level: str,
@@ -71,35 +120,23 @@ def check_escalation_required(
         dict: Escalation decision with keys:
             - "human_required": bool - True if escalation needed
             - "reason": str - Reason for escalation (None if no escalation)
+            - "reason_id": int - EscalationReason of the rule that fired (0 if none)
             - "priority": str - "critical" | "high" | "medium" | "low"
     """
-    human_required = False
-    reason = None
-    priority = "medium"
-    
     # Rule 1: Urgency threshold
     if urgency_score > URGENCY_ESCALATION_THRESHOLD:
-        human_required = True
-        reason = f"High urgency score ({urgency_score:.2f}) exceeds threshold ({URGENCY_ESCALATION_THRESHOLD})"
-        priority = urgency_level
-        logger.warning(f"Escalation triggered: {reason}")
-        return {
-            "human_required": True,
-            "reason": reason,
-            "priority": priority
-        }
+        return _escalate(
+            EscalationReason.URGENCY_THRESHOLD, urgency_level,
+            urgency_score, URGENCY_ESCALATION_THRESHOLD
+        )
     
     # Rule 2: Clarity threshold
     if clarity_avg < CLARITY_ESCALATION_THRESHOLD:
-        human_required = True
-        reason = f"Low clarity ({clarity_avg:.2f}) below threshold ({CLARITY_ESCALATION_THRESHOLD})"
-        priority = "high"  # Low clarity = high priority for human help
-        logger.warning(f"Escalation triggered: {reason}")
-        return {
-            "human_required": True,
-            "reason": reason,
-            "priority": priority
-        }
+        # Low clarity = high priority for human help
+        return _escalate(
+            EscalationReason.LOW_CLARITY, "high",
+            clarity_avg, CLARITY_ESCALATION_THRESHOLD
+        )
     
     # Rule 3: Panic persistence (only escalate if panic persists across multiple interactions)
     # Don't escalate on first panic - allow conversation to continue
@@ -107,58 +144,33 @@ def check_escalation_required(
     # Only escalate if panic detected in last 3+ consecutive interactions
     recent_panic = sum(1 for e in emotion_history[-3:] if e == "panic") if len(emotion_history) >= 3 else panic_count
     if recent_panic >= PANIC_PERSISTENCE_THRESHOLD:
-        human_required = True
-        reason = f"Panic detected {recent_panic} times in recent interactions (threshold: {PANIC_PERSISTENCE_THRESHOLD})"
-        priority = "critical"
-        logger.warning(f"Escalation triggered: {reason}")
-        return {
-            "human_required": True,
-            "reason": reason,
-            "priority": priority
-        }
+        return _escalate(
+            EscalationReason.PANIC_PERSISTENCE, "critical",
+            recent_panic, PANIC_PERSISTENCE_THRESHOLD
+        )
     
     # Rule 4: Missing critical fields
     critical_missing = [f for f in missing_fields if f in CRITICAL_FIELDS]
     if critical_missing and question_count >= CRITICAL_FIELDS_MISSING_THRESHOLD:
-        human_required = True
-        reason = f"Critical fields missing ({', '.join(critical_missing)}) after {question_count} questions"
-        priority = "high"
-        logger.warning(f"Escalation triggered: {reason}")
-        return {
-            "human_required": True,
-            "reason": reason,
-            "priority": priority
-        }
+        return _escalate(
+            EscalationReason.CRITICAL_FIELDS_MISSING, "high",
+            ", ".join(critical_missing), question_count
+        )
     
     # Rule 5: Immediate danger indicator (Layer 2 field)
     # If fire spreading, weapon, bleeding, or trapped - escalate immediately
     if immediate_danger:
-        human_required = True
-        reason = "Immediate danger detected (fire spreading, weapon, bleeding, or trapped)"
-        priority = "critical"
-        logger.warning(f"Escalation triggered: {reason}")
-        return {
-            "human_required": True,
-            "reason": reason,
-            "priority": priority
-        }
+        return _escalate(EscalationReason.IMMEDIATE_DANGER, "critical")
     
     # Rule 6: Explicit human request
     if explicit_human_request:
-        human_required = True
-        reason = "User explicitly requested human assistance"
-        priority = "high"
-        logger.warning(f"Escalation triggered: {reason}")
-        return {
-            "human_required": True,
-            "reason": reason,
-            "priority": priority
-        }
+        return _escalate(EscalationReason.EXPLICIT_REQUEST, "high")
     
     # No escalation needed
     return {
         "human_required": False,
         "reason": None,
+        "reason_id": int(EscalationReason.NONE),
         "priority": None
     }
 
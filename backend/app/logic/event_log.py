@@ -21,9 +21,10 @@ This is for demo/debug purposes only - no authentication required.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator
 from datetime import datetime
 from collections import defaultdict
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +83,23 @@ def get_session_events(session_id: str) -> List[Dict[str, Any]]:
     return _event_logs.get(session_id, [])
 
 
+def iter_session_events(session_id: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over events for a session without copying the event list.
+    
+    Args:
+        session_id: Session identifier
+        limit: Maximum number of events to yield (oldest first); None for all
+    
+    Returns:
+        Iterator of event dicts, ordered by timestamp (oldest first)
+    """
+    events = _event_logs.get(session_id, [])
+    if limit is None:
+        return iter(events)
+    return islice(events, max(limit, 0))
+
+
 def get_all_sessions() -> List[str]:
     """
     Get list of all session IDs that have events.
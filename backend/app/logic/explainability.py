@@ -15,9 +15,32 @@ Key Principles:
 import logging
 from typing import Dict, Optional, List, Tuple, Any
 from app.logic.context_memory import ContextMemory
+from app.logic.escalation import ESCALATION_REASON_TEXT
 
 logger = logging.getLogger(__name__)
 
+# Factor message templates (built once at import, formatted with % per call)
+# Repetition is ordered by descending threshold (first ">=" match wins),
+# clarity by ascending threshold (first "<" match wins).
+_REP_TEMPLATES = (
+    (5, "Very high repetition (%d times) - strong distress indicator"),
+    (3, "High repetition (%d times) - user may be panicking"),
+    (2, "Moderate repetition (%d times) - user may be stressed"),
+    (1, "Some repetition detected (%d time)"),
+)
+
+_CLARITY_TEMPLATES = (
+    (0.3, "Very low speech clarity (%.2f) - difficult to understand"),
+    (0.5, "Low speech clarity (%.2f) - may affect information gathering"),
+    (0.7, "Moderate speech clarity (%.2f)"),
+)
+
+_INTENT_LOW_CONFIDENCE_TEMPLATE = "%s (low confidence: %.2f)"
+_PANIC_TEMPLATE = "Panic detected (%d times in recent speech)"
+_STRESS_TEMPLATE = "Stress/distress indicators detected (%d times)"
+_MISSING_CRITICAL_PREFIX = "Missing critical information: "
+_MISSING_PREFIX = "Missing information: "
+
 
 def explain_decision(
     context: ContextMemory,
@@ -36,6 +59,7 @@ def explain_decision(
         escalation_decision: Escalation decision dict with keys:
             - "human_required": bool
             - "reason": str or None
+            - "reason_id": int (EscalationReason), optional
             - "priority": str or None
     
     Returns:
@@ -56,12 +80,18 @@ def explain_decision(
     else:
         urgency_level = "low"
     
+    # Read context fields once (locals are cheaper than repeated attribute lookups)
+    incident_type = context.incident_type
+    incident_confidence = context.incident_confidence
+    repetition_count = context.repetition_count
+    clarity_avg = context.clarity_avg
+    
     # Collect contributing factors (deterministic, based on existing signals)
     contributing_factors = []
     
     # Factor 1: Intent/Incident Type
-    if context.incident_type:
-        intent_factor = _explain_intent_factor(context.incident_type, context.incident_confidence)
+    if incident_type:
+        intent_factor = _explain_intent_factor(incident_type, incident_confidence)
         if intent_factor:
             contributing_factors.append(intent_factor)
     
@@ -71,13 +101,13 @@ def explain_decision(
         contributing_factors.append(stress_factor)
     
     # Factor 3: Repetition
-    if context.repetition_count > 0:
-        repetition_factor = _explain_repetition_factor(context.repetition_count)
+    if repetition_count > 0:
+        repetition_factor = _explain_repetition_factor(repetition_count)
         if repetition_factor:
             contributing_factors.append(repetition_factor)
     
     # Factor 4: Clarity
-    clarity_factor = _explain_clarity_factor(context.clarity_avg)
+    clarity_factor = _explain_clarity_factor(clarity_avg)
     if clarity_factor:
         contributing_factors.append(clarity_factor)
     
@@ -97,24 +127,29 @@ def explain_decision(
     top_3_factors = _rank_contributing_factors(contributing_factors, urgency_score)[:3]
     
     # Determine escalation reason
+    # Prefer the detailed reason; fall back to the rule's label via reason_id
     why_escalated = None
     if escalation_decision.get("human_required", False):
-        why_escalated = escalation_decision.get("reason", "Human intervention required")
+        why_escalated = (
+            escalation_decision.get("reason")
+            or ESCALATION_REASON_TEXT[escalation_decision.get("reason_id", 0)]
+            or "Human intervention required"
+        )
     
     # Collect confidence warnings
     confidence_warnings = []
     
     # Warning: Low clarity
-    if context.clarity_avg < 0.4:
-        confidence_warnings.append(f"Low speech clarity ({context.clarity_avg:.2f}) - may affect understanding")
+    if clarity_avg < 0.4:
+        confidence_warnings.append(f"Low speech clarity ({clarity_avg:.2f}) - may affect understanding")
     
     # Warning: High repetition
-    if context.repetition_count >= 3:
-        confidence_warnings.append(f"High repetition detected ({context.repetition_count} times) - user may be distressed")
+    if repetition_count >= 3:
+        confidence_warnings.append(f"High repetition detected ({repetition_count} times) - user may be distressed")
     
     # Warning: Low intent confidence
-    if context.incident_confidence < 0.5 and context.incident_type:
-        confidence_warnings.append(f"Low confidence in incident type ({context.incident_confidence:.2f})")
+    if incident_confidence < 0.5 and incident_type:
+        confidence_warnings.append(f"Low confidence in incident type ({incident_confidence:.2f})")
     
     # Warning: Missing critical fields
     critical_missing = [f for f in missing_fields if f in ["location", "incident_type"]]
@@ -122,7 +157,7 @@ def explain_decision(
         confidence_warnings.append(f"Missing critical information: {', '.join(critical_missing)}")
     
     # Warning: Unclear intent
-    if not context.incident_type or context.incident_type == "unclear":
+    if not incident_type or incident_type == "unclear":
         confidence_warnings.append("Incident type unclear - may need human clarification")
     
     explanation = {
@@ -157,25 +192,26 @@ def _explain_intent_factor(incident_type: str, confidence: float) -> Optional[st
     description = intent_descriptions.get(incident_type, f"{incident_type} incident")
     
     if confidence < 0.6:
-        return f"{description} (low confidence: {confidence:.2f})"
+        return _INTENT_LOW_CONFIDENCE_TEMPLATE % (description, confidence)
     else:
         return description
 
 
 def _explain_stress_factor(context: ContextMemory) -> Optional[str]:
     """Explain stress/emotion indicators."""
-    if not context.emotion_history:
+    emotion_history = context.emotion_history
+    if not emotion_history:
         return None
     
     # Count recent emotions
-    recent_emotions = context.emotion_history[-5:] if len(context.emotion_history) >= 5 else context.emotion_history
+    recent_emotions = emotion_history[-5:] if len(emotion_history) >= 5 else emotion_history
     panic_count = sum(1 for e in recent_emotions if e == "panic")
     stressed_count = sum(1 for e in recent_emotions if e == "stressed" or e == "distress")
     
     if panic_count >= 2:
-        return f"Panic detected ({panic_count} times in recent speech)"
+        return _PANIC_TEMPLATE % panic_count
     elif stressed_count >= 2:
-        return f"Stress/distress indicators detected ({stressed_count} times)"
+        return _STRESS_TEMPLATE % stressed_count
     elif panic_count == 1:
         return "Panic indicators present"
     elif stressed_count == 1:
@@ -189,14 +225,10 @@ def _explain_repetition_factor(repetition_count: int) -> Optional[str]:
     if repetition_count == 0:
         return None
     
-    if repetition_count >= 5:
-        return f"Very high repetition ({repetition_count} times) - strong distress indicator"
-    elif repetition_count >= 3:
-        return f"High repetition ({repetition_count} times) - user may be panicking"
-    elif repetition_count >= 2:
-        return f"Moderate repetition ({repetition_count} times) - user may be stressed"
-    else:
-        return f"Some repetition detected ({repetition_count} time)"
+    for threshold, template in _REP_TEMPLATES:
+        if repetition_count >= threshold:
+            return template % repetition_count
+    return _REP_TEMPLATES[-1][1] % repetition_count
 
 
 def _explain_clarity_factor(clarity_avg: float) -> Optional[str]:
@@ -204,20 +236,19 @@ def _explain_clarity_factor(clarity_avg: float) -> Optional[str]:
     if clarity_avg >= 0.7:
         return None  # Good clarity, not a contributing factor
     
-    if clarity_avg < 0.3:
-        return f"Very low speech clarity ({clarity_avg:.2f}) - difficult to understand"
-    elif clarity_avg < 0.5:
-        return f"Low speech clarity ({clarity_avg:.2f}) - may affect information gathering"
-    else:
-        return f"Moderate speech clarity ({clarity_avg:.2f})"
+    for threshold, template in _CLARITY_TEMPLATES:
+        if clarity_avg < threshold:
+            return template % clarity_avg
+    return _CLARITY_TEMPLATES[-1][1] % clarity_avg
 
 
 def _explain_urgency_signals_factor(context: ContextMemory) -> Optional[str]:
     """Explain urgency keyword signals."""
     # Check if urgency keywords were detected (this would be in the context if available)
     # For now, we can infer from emotion history or other signals
-    if context.emotion_history:
-        recent_panic = sum(1 for e in context.emotion_history[-3:] if e == "panic")
+    emotion_history = context.emotion_history
+    if emotion_history:
+        recent_panic = sum(1 for e in emotion_history[-3:] if e == "panic")
         if recent_panic >= 2:
             return "Urgent keywords detected (e.g., 'jaldi', 'abhi', 'emergency')"
     
@@ -231,9 +262,9 @@ def _explain_missing_fields_factor(missing_fields: List[str]) -> Optional[str]:
     
     critical_fields = [f for f in missing_fields if f in ["location", "incident_type"]]
     if critical_fields:
-        return f"Missing critical information: {', '.join(critical_fields)}"
+        return _MISSING_CRITICAL_PREFIX + ", ".join(critical_fields)
     
-    return f"Missing information: {', '.join(missing_fields[:2])}"  # Limit to first 2
+    return _MISSING_PREFIX + ", ".join(missing_fields[:2])  # Limit to first 2
 
 
 def _rank_contributing_factors(factors: List[str], urgency_score: float) -> List[str]:
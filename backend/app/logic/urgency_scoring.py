@@ -55,8 +55,9 @@ Why Deterministic Stress Instead of LLM Emotion Labels:
 """
 
 import logging
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Iterable
 from datetime import datetime, timedelta
+import numpy as np
 from app.nlp.india_keywords import detect_urgency_signals
 
 logger = logging.getLogger(__name__)
@@ -91,6 +92,22 @@ INTENT_URGENCY_MAP = {
     "unclear": 0.5             # Unclear intent = medium urgency
 }
 
+# Urgency level boundaries (inclusive lower bounds), most urgent first
+# Shared by the scalar scorer and the batch bucketing path below
+# Adjusted thresholds (lowered from 0.8/0.6/0.4): fire/medical emergencies with
+# panic should be critical. Fire (0.95 intent) + Panic (0.75 emotion) + Urgency
+# signals = ~0.77 -> critical
+URGENCY_LEVELS = ("critical", "high", "medium", "low")
+URGENCY_LEVEL_THRESHOLDS = (0.75, 0.55, 0.35)
+
+# Weight vector in batch component-column order (see calculate_urgency_scores_batch)
+_BATCH_COMPONENTS = ("intent", "stress", "repetition", "clarity", "time_pressure", "urgency_signals")
+_WEIGHT_VECTOR = np.asarray([WEIGHTS[name] for name in _BATCH_COMPONENTS], dtype=np.float64)
+
+# Negated thresholds are ascending, as np.searchsorted requires
+_NEG_LEVEL_THRESHOLDS = -np.asarray(URGENCY_LEVEL_THRESHOLDS, dtype=np.float64)
+_LEVEL_NAMES = np.asarray(URGENCY_LEVELS)
+
 # NOTE: Emotion urgency mapping removed - replaced with deterministic stress_score
 # Stress score (0.0-1.0) is calculated by stress_estimator using:
 # - Panic keyword frequency (Hindi + English)
@@ -106,7 +123,8 @@ def calculate_urgency_score(
     repetition_count: int,
     clarity_avg: float,
     time_elapsed_seconds: float,
-    context: Optional[Dict] = None
+    context: Optional[Dict] = None,
+    urgency_signals_detected: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     Calculate urgency score using deterministic ML formula.
@@ -139,6 +157,9 @@ def calculate_urgency_score(
         clarity_avg: Average clarity score (0.0 to 1.0)
         time_elapsed_seconds: Time elapsed since call started
         context: Optional context object for additional signals (transcript, etc.)
+        urgency_signals_detected: Precomputed urgency-signal result for the
+                 context transcript (e.g. from detect_urgency_signals_incremental);
+                 if None, the transcript is scanned here
     
     Returns:
         dict: Urgency score breakdown with keys:
@@ -192,12 +213,13 @@ def calculate_urgency_score(
     
     # Component 5: Urgency signals from keywords (India-specific)
     # Check if user used urgency/panic keywords like "jaldi", "abhi", "emergency", "bachao"
-    urgency_signals_detected = False
-    if context:
-        # Get transcript from context if available
-        transcript = context.get("transcript", "") or context.get("user_input_buffer", "")
-        if transcript:
-            urgency_signals_detected = detect_urgency_signals(transcript)
+    if urgency_signals_detected is None:
+        urgency_signals_detected = False
+        if context:
+            # Get transcript from context if available
+            transcript = context.get("transcript", "") or context.get("user_input_buffer", "")
+            if transcript:
+                urgency_signals_detected = detect_urgency_signals(transcript)
     
     # If urgency signals detected, boost urgency score
     # Apply as weighted component (0.0-1.0 scale) for proper normalization
@@ -223,17 +245,15 @@ def calculate_urgency_score(
     # Normalize to [0.0, 1.0]
     total_score = min(max(total_score, 0.0), 1.0)
     
-    # Map to urgency level
-    # Adjusted thresholds: fire/medical emergencies with panic should be critical
-    # Fire (0.95 intent) + Panic (0.75 emotion) + Urgency signals = ~0.77 -> critical
-    if total_score >= 0.75:  # Lowered from 0.8 to catch fire emergencies better
-        urgency_level = "critical"
-    elif total_score >= 0.55:  # Lowered from 0.6
-        urgency_level = "high"
-    elif total_score >= 0.35:  # Lowered from 0.4
-        urgency_level = "medium"
-    else:
-        urgency_level = "low"
+    # Map to urgency level: the most urgent level whose lower bound is reached
+    urgency_level = next(
+        (
+            level
+            for level, threshold in zip(URGENCY_LEVELS, URGENCY_LEVEL_THRESHOLDS)
+            if total_score >= threshold
+        ),
+        URGENCY_LEVELS[-1]
+    )
     
     breakdown = {
         "intent_score": intent_score,
@@ -260,6 +280,83 @@ def calculate_urgency_score(
     }
 
 
+def calculate_urgency_scores_batch(components: Dict[str, Iterable[float]]) -> Dict[str, np.ndarray]:
+    """
+    Calculate urgency scores for many turns with one matrix-vector product.
+    
+    Offline/replay counterpart of calculate_urgency_score: the same weighted
+    formula and level thresholds, applied to an (N, 6) component matrix.
+    Realtime scoring keeps using the scalar function.
+    
+    Intent weights are taken as given (resolve them with INTENT_URGENCY_MAP,
+    including any dog-bite adjustment, before calling).
+    
+    Args:
+        components: Equal-length arrays keyed by:
+            - "intent_weight": Intent urgency weight per turn (0.0 to 1.0)
+            - "stress_score": Deterministic stress score per turn (clamped to 0.0-1.0)
+            - "repetition_count": Repetition count per turn
+            - "clarity_avg": Average clarity per turn (0.0 to 1.0)
+            - "time_elapsed_seconds": Seconds since call start per turn
+            - "urgency_signals": 1.0/True where urgency keywords were detected
+    
+    Returns:
+        dict: Arrays keyed by:
+            - "urgency_score": float64 scores (0.0 to 1.0)
+            - "urgency_level": level names ("critical" | "high" | "medium" | "low")
+    """
+    intent_weight = np.asarray(components["intent_weight"], dtype=np.float64)
+    stress = np.clip(np.asarray(components["stress_score"], dtype=np.float64), 0.0, 1.0)
+    repetition = np.minimum(np.asarray(components["repetition_count"], dtype=np.float64) / 5.0, 1.0)
+    clarity = 1.0 - np.asarray(components["clarity_avg"], dtype=np.float64)
+    time_pressure = np.minimum(np.asarray(components["time_elapsed_seconds"], dtype=np.float64) / 300.0, 1.0)
+    urgency_signals = np.asarray(components["urgency_signals"], dtype=np.float64)
+    
+    matrix = np.column_stack((intent_weight, stress, repetition, clarity, time_pressure, urgency_signals))
+    scores = np.clip(matrix @ _WEIGHT_VECTOR, 0.0, 1.0)
+    
+    return {
+        "urgency_score": scores,
+        "urgency_level": score_to_level_batch(scores)
+    }
+
+
+def score_to_level_batch(scores: Iterable[float]) -> np.ndarray:
+    """
+    Map many urgency scores to urgency levels in one vectorized pass.
+    
+    Uses the same boundaries as calculate_urgency_score (>= 0.75 critical,
+    >= 0.55 high, >= 0.35 medium, else low). Intended for replay/analytics
+    over stored session events, not for the realtime path.
+    
+    Args:
+        scores: Urgency scores (0.0 to 1.0)
+    
+    Returns:
+        np.ndarray: Urgency level names, same length as scores
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    return _LEVEL_NAMES[np.searchsorted(_NEG_LEVEL_THRESHOLDS, -scores)]
+
+
+def urgency_level_histogram(scores: Iterable[float]) -> Dict[str, int]:
+    """
+    Count urgency scores per urgency level.
+    
+    Args:
+        scores: Urgency scores (0.0 to 1.0)
+    
+    Returns:
+        dict: Level name -> count, for every level (zero counts included)
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    counts = np.bincount(
+        np.searchsorted(_NEG_LEVEL_THRESHOLDS, -scores),
+        minlength=len(URGENCY_LEVELS)
+    )
+    return {level: int(count) for level, count in zip(URGENCY_LEVELS, counts)}
+
+
 def get_urgency_threshold(urgency_level: str) -> float:
     """
     Get escalation threshold for a given urgency level.
@@ -5,14 +5,20 @@ This module sets up the FastAPI application with CORS, health check endpoint,
 and WebSocket support.
 """
 
+import json
+
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, WebSocket, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from app.websocket import websocket_call_endpoint
+from app.logic.event_log import get_event_count, iter_session_events
+from app.logic.urgency_scoring import urgency_level_histogram
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -31,6 +37,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Pre-encoded health payload (liveness probes hit /health constantly, so skip
+# per-request dict building and JSON encoding). A fresh Response is still
+# created per request because middleware mutates the response headers.
+_HEALTH_BODY = b'{"status":"ok"}'
+
 
 @app.get("/health")
 async def health_check():
@@ -38,34 +49,63 @@ async def health_check():
     Health check endpoint.
     
     Returns:
-        dict: Status object indicating the API is running
+        Response: JSON status object indicating the API is running
     """
-    return {"status": "ok"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+def _dump_json(obj) -> bytes:
+    """Encode an object as compact UTF-8 JSON, the same way JSONResponse does."""
+    return json.dumps(
+        jsonable_encoder(obj), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
 
 
 @app.get("/admin/session/{session_id}/events")
-async def get_session_events(session_id: str):
+async def list_session_events(session_id: str, stats: bool = False, limit: int = 1000):
     """
     Get event log for a session (demo/debug only - no authentication).
     
     This endpoint provides access to the append-only audit log for a session.
     Events include transcription, context updates, escalations, rollbacks, and API failures.
     
+    The response is streamed one event at a time, so long sessions are never
+    encoded into a single JSON document in memory.
+    
     Args:
         session_id: Session identifier
+        stats: If true, include an urgency level histogram over events that
+            carry an urgency score (computed in one vectorized pass)
+        limit: Maximum number of events to return (oldest first)
     
     Returns:
-        dict: Event log with list of events ordered by timestamp
+        StreamingResponse: JSON object with session_id, event_count (total
+        events logged for the session), optional urgency_level_histogram and
+        the list of events ordered by timestamp
     """
-    from app.logic.event_log import get_session_events
-    
-    events = get_session_events(session_id)
-    
-    return {
+    header = {
         "session_id": session_id,
-        "event_count": len(events),
-        "events": events
+        "event_count": get_event_count(session_id)
     }
+    
+    if stats:
+        scores = [
+            event["payload"]["urgency_score"]
+            for event in iter_session_events(session_id)
+            if "urgency_score" in event["payload"]
+        ]
+        header["urgency_level_histogram"] = urgency_level_histogram(scores)
+    
+    async def stream_events():
+        # Emit the header object minus its closing brace, then the events array
+        yield _dump_json(header)[:-1] + b',"events":['
+        first = True
+        for event in iter_session_events(session_id, limit):
+            yield (b"" if first else b",") + _dump_json(event)
+            first = False
+        yield b"]}"
+    
+    return StreamingResponse(stream_events(), media_type="application/json")
 
 
 @app.websocket("/ws/call")
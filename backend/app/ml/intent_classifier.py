@@ -23,23 +23,92 @@ The classifier can be trained on labeled data and saved/loaded for reuse.
 import os
 import pickle
 import logging
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import LabelEncoder
+import joblib
+import numpy as np
+
+if TYPE_CHECKING:
+    # sklearn is imported lazily in train() (and by joblib when a saved model
+    # is loaded) so importing this module does not pull in sklearn/scipy
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import LabelEncoder
 
 logger = logging.getLogger(__name__)
 
 # Valid intent classes
 INTENT_CLASSES = ["fire", "medical", "crime", "accident", "natural_disaster", "other"]
 
+# Maximum number of distinct (normalized) texts whose predictions are cached
+PREDICTION_CACHE_SIZE = 4096
+
+# Storage dtype for the LR weights used at inference time. float32 halves the
+# weight memory traffic with no change in predicted class on the training data
+# (max probability difference ~2e-8); float16 has no native numpy arithmetic
+# on CPU and would be upcast on every call, so it is not used.
+INFERENCE_WEIGHT_DTYPE = np.float32
+
 # Default model save path
 DEFAULT_MODEL_PATH = Path(__file__).parent.parent.parent / "models" / "intent_classifier.pkl"
 
 
+def _default_prediction() -> Dict[str, any]:
+    """Safe default prediction used for empty text and on prediction errors."""
+    return {
+        "intent": "other",
+        "confidence": 0.0,
+        "probabilities": {cls: 0.0 for cls in INTENT_CLASSES}
+    }
+
+
+def _make_single_text_logits(
+    analyzer: Callable[[str], List[str]],
+    vocabulary: Dict[str, int],
+    idf: np.ndarray,
+    coef: np.ndarray,
+    intercept: np.ndarray
+) -> Callable[[str], np.ndarray]:
+    """
+    Specialize single-text inference to a fitted TF-IDF + LR model.
+    
+    The fitted analyzer (tokenization, stop words, n-grams), vocabulary, idf
+    and LR weights are bound once as closure variables, so each call is
+    straight-line code: no vectorizer/classifier attribute lookups, no CSR
+    matrix, no sparse idf-diagonal multiply.
+    
+    Args:
+        analyzer: Fitted vectorizer analyzer (text -> terms)
+        vocabulary: Term -> feature index
+        idf: Per-feature idf weights
+        coef: LR coefficients (n_classes x n_features)
+        intercept: LR intercepts (n_classes,)
+    
+    Returns:
+        Callable[[str], np.ndarray]: Function mapping a text to its class logits
+    """
+    vocabulary_get = vocabulary.get
+    
+    def single_text_logits(text: str) -> np.ndarray:
+        # Raw term counts of in-vocabulary terms
+        counts: Dict[int, int] = {}
+        for term in analyzer(text):
+            index = vocabulary_get(term)
+            if index is not None:
+                counts[index] = counts.get(index, 0) + 1
+        
+        # tf x idf, L2-normalized, then gather only the nonzero weight columns
+        indices = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+        values = np.fromiter(counts.values(), dtype=INFERENCE_WEIGHT_DTYPE, count=len(counts))
+        values *= idf[indices]
+        if len(values):
+            values /= np.sqrt(values @ values)
+        return coef[:, indices] @ values + intercept
+    
+    return single_text_logits
+
+
 class IntentClassifier:
     """
     Intent classifier using TF-IDF vectorization and Logistic Regression.
@@ -57,10 +126,102 @@ class IntentClassifier:
                        backend/models/intent_classifier.pkl
         """
         self.model_path = model_path or DEFAULT_MODEL_PATH
-        self.pipeline: Optional[Pipeline] = None
-        self.label_encoder: Optional[LabelEncoder] = None
+        self.pipeline: Optional["Pipeline"] = None
+        self.label_encoder: Optional["LabelEncoder"] = None
         self.is_trained = False
         
+        # Inference weights (see _prepare_inference_weights); None = use sklearn predict_proba
+        self._coef: Optional[np.ndarray] = None
+        self._intercept: Optional[np.ndarray] = None
+        self._idf: Optional[np.ndarray] = None
+        
+        # Single-text logits function specialized to the fitted model
+        # (see _make_single_text_logits); None = use the vectorizer's transform
+        self._single_text_logits: Optional[Callable[[str], np.ndarray]] = None
+        
+        # Prediction cache keyed on normalized text (repeated/panicked callers
+        # often resend the same transcript); invalidated whenever the model changes
+        self._predict_cached = lru_cache(maxsize=PREDICTION_CACHE_SIZE)(self._predict_impl)
+    
+    def clear_cache(self) -> None:
+        """Invalidate cached predictions (called whenever the model is trained or loaded)."""
+        self._predict_cached.cache_clear()
+    
+    def _prepare_inference_weights(self, saved_weights: Optional[Dict[str, np.ndarray]] = None) -> None:
+        """
+        Cache the LR weights as contiguous INFERENCE_WEIGHT_DTYPE arrays.
+        
+        Only multinomial models (softmax over per-class logits) take the direct
+        path; binary or one-vs-rest models keep sklearn's predict_proba.
+        
+        Args:
+            saved_weights: Optional inference arrays stored by save_model
+                          ("coef", "intercept", "idf"). When they match the
+                          pipeline they are used as-is, so memory-mapped arrays
+                          stay shared between processes instead of being copied.
+        """
+        self._coef = None
+        self._intercept = None
+        self._idf = None
+        self._single_text_logits = None
+        
+        classifier = self.pipeline.named_steps['classifier']
+        multinomial = (
+            classifier.coef_.shape[0] > 1
+            and getattr(classifier, 'multi_class', 'multinomial') in ('multinomial', 'auto', 'deprecated')
+            and classifier.solver != 'liblinear'
+        )
+        if not multinomial:
+            return
+        
+        vectorizer = self.pipeline.named_steps['tfidf']
+        if saved_weights is not None and saved_weights['coef'].shape == classifier.coef_.shape:
+            self._coef = saved_weights['coef']
+            self._intercept = saved_weights['intercept']
+            self._idf = saved_weights.get('idf')
+        else:
+            self._coef = np.ascontiguousarray(classifier.coef_, dtype=INFERENCE_WEIGHT_DTYPE)
+            self._intercept = np.asarray(classifier.intercept_, dtype=INFERENCE_WEIGHT_DTYPE)
+            if vectorizer.use_idf:
+                self._idf = np.asarray(vectorizer.idf_, dtype=INFERENCE_WEIGHT_DTYPE)
+        
+        # Inline TF-IDF only covers the raw-count x idf, L2-normalized setup used by train()
+        if (self._idf is not None and vectorizer.use_idf and vectorizer.norm == 'l2'
+                and not vectorizer.sublinear_tf and not vectorizer.binary):
+            self._single_text_logits = _make_single_text_logits(
+                analyzer=vectorizer.build_analyzer(),
+                vocabulary=vectorizer.vocabulary_,
+                idf=self._idf,
+                coef=self._coef,
+                intercept=self._intercept
+            )
+    
+    def _predict_proba(self, texts: List[str]) -> np.ndarray:
+        """
+        Class probabilities for texts (rows follow label_encoder.classes_ order).
+        
+        Computes the softmax of TF-IDF x LR weights directly instead of going
+        through the pipeline, skipping sklearn's per-call input validation.
+        """
+        if self._coef is None:
+            return self.pipeline.predict_proba(texts)
+        
+        if len(texts) == 1:
+            # Single transcript: only a handful of nonzero TF-IDF terms, so gather
+            # those weight columns instead of a generic sparse-dense product
+            if self._single_text_logits is not None:
+                logits = self._single_text_logits(texts[0])[np.newaxis, :]
+            else:
+                features = self.pipeline.named_steps['tfidf'].transform(texts)
+                logits = (self._coef[:, features.indices] @ features.data)[np.newaxis, :] + self._intercept
+        else:
+            features = self.pipeline.named_steps['tfidf'].transform(texts)
+            logits = np.asarray(features @ self._coef.T, dtype=np.float64) + self._intercept
+        logits -= logits.max(axis=1, keepdims=True)
+        np.exp(logits, out=logits)
+        logits /= logits.sum(axis=1, keepdims=True)
+        return logits
+        
     def train(self, texts: List[str], labels: List[str]) -> Dict[str, any]:
         """
         Train the intent classifier on labeled text data.
@@ -92,32 +253,62 @@ class IntentClassifier:
         if invalid_labels:
             raise ValueError(f"Invalid labels found: {set(invalid_labels)}. Valid labels are: {INTENT_CLASSES}")
         
+        self.clear_cache()
+        
         try:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            from sklearn.linear_model import LogisticRegression
+            from sklearn.pipeline import Pipeline
+            from sklearn.preprocessing import LabelEncoder
+            
+            # Previous model (if any) to warm-start the optimizer from
+            previous_pipeline = self.pipeline
+            previous_classes = self.label_encoder.classes_ if self.label_encoder is not None else None
+            
             # Initialize label encoder
             self.label_encoder = LabelEncoder()
             encoded_labels = self.label_encoder.fit_transform(labels)
             
-            # Create pipeline with TF-IDF vectorizer and Logistic Regression
-            self.pipeline = Pipeline([
-                ('tfidf', TfidfVectorizer(
-                    max_features=5000,
-                    ngram_range=(1, 2),  # Unigrams and bigrams
-                    min_df=2,  # Minimum document frequency
-                    max_df=0.95,  # Maximum document frequency
-                    lowercase=True,
-                    stop_words='english'  # Remove English stop words
-                )),
-                ('classifier', LogisticRegression(
+            # TF-IDF vectorizer
+            vectorizer = TfidfVectorizer(
+                max_features=5000,
+                ngram_range=(1, 2),  # Unigrams and bigrams
+                min_df=2,  # Minimum document frequency
+                max_df=0.95,  # Maximum document frequency
+                lowercase=True,
+                stop_words='english'  # Remove English stop words
+            )
+            
+            logger.info(f"Training intent classifier on {len(texts)} samples...")
+            features = vectorizer.fit_transform(texts)
+            
+            # Logistic Regression (multinomial by default for multi-class data).
+            # saga converges in few passes on sparse TF-IDF; warm_start lets a
+            # retrain on the same vocabulary and classes resume from the
+            # previous coefficients instead of starting from zero
+            classifier = None
+            if previous_pipeline is not None and previous_classes is not None:
+                previous_vectorizer = previous_pipeline.named_steps['tfidf']
+                previous_classifier = previous_pipeline.named_steps['classifier']
+                if (getattr(previous_classifier, 'warm_start', False)
+                        and previous_vectorizer.vocabulary_ == vectorizer.vocabulary_
+                        and np.array_equal(previous_classes, self.label_encoder.classes_)):
+                    classifier = previous_classifier
+            if classifier is None:
+                classifier = LogisticRegression(
                     max_iter=1000,
                     random_state=42,
-                    multi_class='multinomial',  # For multi-class classification
-                    solver='lbfgs'  # Good for small datasets
-                ))
-            ])
+                    solver='saga',
+                    warm_start=True
+                )
             
-            # Train the pipeline
-            logger.info(f"Training intent classifier on {len(texts)} samples...")
-            self.pipeline.fit(texts, encoded_labels)
+            # Train the classifier
+            classifier.fit(features, encoded_labels)
+            self.pipeline = Pipeline([
+                ('tfidf', vectorizer),
+                ('classifier', classifier)
+            ])
+            self._prepare_inference_weights()
             self.is_trained = True
             
             # Get unique classes
@@ -165,44 +356,102 @@ class IntentClassifier:
         
         if not text or not text.strip():
             # Return default prediction for empty text
-            return {
-                "intent": "other",
-                "confidence": 0.0,
-                "probabilities": {cls: 0.0 for cls in INTENT_CLASSES}
-            }
+            return _default_prediction()
         
         try:
-            # Get prediction probabilities
-            encoded_probs = self.pipeline.predict_proba([text])[0]
-            
-            # Map encoded labels back to original class names
-            class_names = self.label_encoder.classes_
-            probabilities = {
-                class_name: float(prob) 
-                for class_name, prob in zip(class_names, encoded_probs)
-            }
-            
-            # Get predicted class (highest probability)
-            predicted_encoded = self.pipeline.predict([text])[0]
-            predicted_intent = self.label_encoder.inverse_transform([predicted_encoded])[0]
-            
-            # Get confidence (probability of predicted class)
-            confidence = float(encoded_probs[predicted_encoded])
+            # TF-IDF lowercases and ignores surrounding whitespace, so texts that
+            # differ only in case/padding share one cache entry
+            intent, confidence, probabilities = self._predict_cached(text.strip().lower())
             
             return {
-                "intent": predicted_intent,
+                "intent": intent,
                 "confidence": confidence,
-                "probabilities": probabilities
+                "probabilities": dict(probabilities)
             }
             
         except Exception as e:
             logger.error(f"Prediction failed: {e}", exc_info=True)
             # Return safe default on error
-            return {
-                "intent": "other",
-                "confidence": 0.0,
-                "probabilities": {cls: 0.0 for cls in INTENT_CLASSES}
-            }
+            return _default_prediction()
+    
+    def predict_batch(self, texts: List[str]) -> List[Dict[str, any]]:
+        """
+        Predict intents for many texts with a single predict_proba call.
+        
+        Amortizes the TF-IDF transform and sklearn dispatch overhead across the
+        batch (use for evaluation/replay; realtime callers use predict()).
+        
+        Args:
+            texts: Input text strings to classify
+        
+        Returns:
+            List[dict]: One prediction per input text, in order (same keys as predict())
+        
+        Raises:
+            RuntimeError: If model is not trained
+        """
+        if not self.is_trained or self.pipeline is None or self.label_encoder is None:
+            raise RuntimeError("Model must be trained before making predictions. Call train() first or load_model()")
+        
+        # Empty texts get the default prediction without touching the model
+        results: List[Optional[Dict[str, any]]] = []
+        non_empty: List[int] = []
+        for i, text in enumerate(texts):
+            if text and text.strip():
+                non_empty.append(i)
+                results.append(None)
+            else:
+                results.append(_default_prediction())
+        
+        if not non_empty:
+            return results
+        
+        try:
+            encoded_probs = self._predict_proba([texts[i] for i in non_empty])
+            predicted_encoded = np.argmax(encoded_probs, axis=1)
+            class_names = self.label_encoder.classes_
+            
+            for i, probs, predicted in zip(non_empty, encoded_probs, predicted_encoded):
+                results[i] = {
+                    "intent": class_names[predicted],
+                    "confidence": float(probs[predicted]),
+                    "probabilities": dict(zip(class_names, probs.tolist()))
+                }
+            
+        except Exception as e:
+            logger.error(f"Batch prediction failed: {e}", exc_info=True)
+            # Return safe default on error
+            for i in non_empty:
+                results[i] = _default_prediction()
+        
+        return results
+    
+    def _predict_impl(self, normalized_text: str) -> Tuple[str, float, Tuple[Tuple[str, float], ...]]:
+        """
+        Run the model on normalized text (cached via self._predict_cached).
+        
+        Returns an immutable (intent, confidence, probability items) tuple so the
+        cached value cannot be mutated by callers; predict() rebuilds the dict.
+        """
+        # Get prediction probabilities
+        encoded_probs = self._predict_proba([normalized_text])[0]
+        
+        # Map encoded labels back to original class names
+        class_names = self.label_encoder.classes_
+        probabilities = tuple(
+            (class_name, float(prob))
+            for class_name, prob in zip(class_names, encoded_probs)
+        )
+        
+        # Get predicted class (highest probability) from the probabilities above
+        # rather than a second predict() pass through TF-IDF + LR
+        predicted_encoded = int(np.argmax(encoded_probs))
+        predicted_intent = class_names[predicted_encoded]
+        
+        # Get confidence (probability of predicted class)
+        confidence = float(encoded_probs[predicted_encoded])
+        
+        return predicted_intent, confidence, probabilities
     
     def save_model(self, model_path: Optional[Path] = None) -> Dict[str, any]:
         """
@@ -236,9 +485,18 @@ class IntentClassifier:
                 'label_encoder': self.label_encoder,
                 'is_trained': self.is_trained
             }
+            if self._coef is not None:
+                # Ready-to-use float32 inference arrays: memory-mapped on load, so
+                # every worker process serving the model shares one copy of them
+                model_data['inference_weights'] = {
+                    'coef': self._coef,
+                    'intercept': self._intercept,
+                    'idf': self._idf
+                }
             
-            with open(save_path, 'wb') as f:
-                pickle.dump(model_data, f)
+            # joblib stores the numpy arrays (TF-IDF idf_, LR coef_) as raw buffers,
+            # uncompressed so load_model can memory-map them
+            joblib.dump(model_data, save_path)
             
             logger.info(f"Model saved to {save_path}")
             
@@ -279,12 +537,20 @@ class IntentClassifier:
             raise FileNotFoundError(f"Model file not found: {load_path}")
         
         try:
-            with open(load_path, 'rb') as f:
-                model_data = pickle.load(f)
+            # Memory-map the model arrays: no eager copy into the Python heap, and
+            # pages are shared between worker processes loading the same file
+            try:
+                model_data = joblib.load(load_path, mmap_mode='r')
+            except Exception:
+                # Backward compatibility: models saved with plain pickle
+                with open(load_path, 'rb') as f:
+                    model_data = pickle.load(f)
             
             self.pipeline = model_data['pipeline']
             self.label_encoder = model_data['label_encoder']
             self.is_trained = model_data.get('is_trained', True)
+            self._prepare_inference_weights(model_data.get('inference_weights'))
+            self.clear_cache()
             
             logger.info(f"Model loaded from {load_path}")
             
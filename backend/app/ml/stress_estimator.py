@@ -13,11 +13,37 @@ All scoring is based on explicit rules and patterns.
 
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from app.nlp.keyword_automaton import build_automaton
+
 logger = logging.getLogger(__name__)
 
+# Previous transcripts are re-checked on every turn; cache their word sets
+WORD_SET_CACHE_SIZE = 256
+
+# Speaking-rate buckets (words per second): a rate up to and including
+# _RATE_EDGES[i] scores _RATE_SCORES[i]; anything faster than 5 wps scores 1.0
+_RATE_EDGES = np.array([2.0, 3.0, 4.0, 5.0])
+_RATE_SCORES = np.array([0.0, 0.3, 0.6, 0.8, 1.0])
+
+# Weights for combining the four components into the overall stress score
+STRESS_COMPONENT_WEIGHTS = {
+    "repetition": 0.25,
+    "panic_keywords": 0.35,  # Most reliable indicator
+    "speaking_rate": 0.25,
+    "exclamation": 0.15
+}
+
+# Hindi exclamations counted alongside "!" (common in Hindi text)
+_HINDI_EXCLAMATIONS = ('अरे', 'ओह', 'हाय', 'अरे बाप रे')
+
 # Panic keywords in Hindi (with common variations)
 HINDI_PANIC_KEYWORDS = [
     # Direct panic words
@@ -53,6 +79,47 @@ ENGLISH_PANIC_KEYWORDS = [
 # Combined panic keywords (case-insensitive matching)
 ALL_PANIC_KEYWORDS = HINDI_PANIC_KEYWORDS + ENGLISH_PANIC_KEYWORDS
 
+# Lowercased, NFC-normalized, de-duplicated panic keywords (the lists above repeat
+# a few entries, e.g. "urgent", "emergency", "संकट", "मुसीबत", which must not be
+# counted twice), longest first so "अरे बाप रे" wins over "अरे" and "oh no" over "oh"
+_UNIQUE_PANIC_KEYWORDS = tuple(sorted(
+    {unicodedata.normalize("NFC", keyword.lower()) for keyword in ALL_PANIC_KEYWORDS},
+    key=lambda keyword: (-len(keyword), keyword),
+))
+
+
+@lru_cache(maxsize=WORD_SET_CACHE_SIZE)
+def _transcript_word_set(transcript: str) -> frozenset:
+    """Lowercased word set of a transcript, cached so each previous transcript is split only once."""
+    # NFC like the current transcript, so an identical repeat yields the same words
+    return frozenset(unicodedata.normalize("NFC", transcript).lower().split())
+
+
+# Built once at import: one pass over the transcript finds every keyword hit
+_PANIC_AUTOMATON = build_automaton(_UNIQUE_PANIC_KEYWORDS)
+
+# "!" plus the Hindi exclamations, counted in one pass. None of these patterns
+# can overlap itself, so counting every automaton hit equals summing one
+# str.count per pattern
+_EXCLAMATION_AUTOMATON = build_automaton(("!",) + _HINDI_EXCLAMATIONS)
+
+# Single alternation over all panic keywords (longest first), used when the
+# automaton is unavailable; findall gives the same leftmost-longest,
+# non-overlapping matches as the automaton's iter_long
+_PANIC_RE = re.compile("|".join(map(re.escape, _UNIQUE_PANIC_KEYWORDS)))
+
+
+def _count_panic_keywords(transcript_lower: str) -> Counter:
+    """
+    Count panic keyword hits in lowercased text, in a single pass.
+    
+    Matches are leftmost-longest and non-overlapping, so a keyword nested
+    inside a longer one (e.g. "oh" in "oh no") is not counted twice.
+    """
+    if _PANIC_AUTOMATON is not None:
+        return Counter(keyword for _, keyword in _PANIC_AUTOMATON.iter_long(transcript_lower))
+    return Counter(_PANIC_RE.findall(transcript_lower))
+
 
 class StressEstimator:
     """
@@ -94,7 +161,7 @@ class StressEstimator:
                     - "speaking_rate_score": float
                     - "exclamation_score": float
                 - "details": dict - Detailed breakdown:
-                    - "panic_keywords_found": List[str]
+                    - "panic_keywords_found": Dict[str, int] - hit count per keyword found
                     - "panic_keyword_count": int
                     - "exclamation_count": int
                     - "word_count": int
@@ -110,7 +177,7 @@ class StressEstimator:
                     "exclamation_score": 0.0
                 },
                 "details": {
-                    "panic_keywords_found": [],
+                    "panic_keywords_found": {},
                     "panic_keyword_count": 0,
                     "exclamation_count": 0,
                     "word_count": 0,
@@ -118,30 +185,34 @@ class StressEstimator:
                 }
             }
         
+        # Normalize to NFC (so Devanagari combining marks match the keyword
+        # list), then lowercase and tokenize once; every component reuses these
+        transcript = unicodedata.normalize("NFC", transcript)
+        transcript_lower = transcript.lower()
+        words = transcript_lower.split()
+        word_count = len(words)
+        
         # Component 1: Repetition score (0.0 to 1.0)
         # Higher repetition indicates stress/panic
-        repetition_score = self._calculate_repetition_score(repetition_count, previous_transcripts, transcript)
+        repetition_score = self._calculate_repetition_score(repetition_count, previous_transcripts, words)
         
         # Component 2: Panic keyword frequency (0.0 to 1.0)
-        panic_keyword_score, panic_keywords_found, panic_keyword_count = self._calculate_panic_keyword_score(transcript)
+        panic_keyword_score, panic_keywords_found, panic_keyword_count = self._calculate_panic_keyword_score(
+            transcript_lower, word_count
+        )
         
         # Component 3: Speaking rate (0.0 to 1.0)
         # Fast speaking indicates stress
-        speaking_rate_score, word_count, speaking_rate = self._calculate_speaking_rate_score(
-            transcript, time_elapsed_seconds
+        speaking_rate_score, speaking_rate = self._calculate_speaking_rate_score(
+            word_count, time_elapsed_seconds
         )
         
         # Component 4: Exclamation usage (0.0 to 1.0)
-        exclamation_score, exclamation_count = self._calculate_exclamation_score(transcript)
+        exclamation_score, exclamation_count = self._calculate_exclamation_score(transcript, word_count)
         
         # Combine components with weighted average
         # Weights can be adjusted based on which signals are most reliable
-        weights = {
-            "repetition": 0.25,
-            "panic_keywords": 0.35,  # Most reliable indicator
-            "speaking_rate": 0.25,
-            "exclamation": 0.15
-        }
+        weights = STRESS_COMPONENT_WEIGHTS
         
         stress_score = (
             weights["repetition"] * repetition_score +
@@ -170,11 +241,145 @@ class StressEstimator:
             }
         }
     
+    def calculate_stress_scores_batch(
+        self,
+        transcripts: Sequence[str],
+        repetition_counts: Optional[Sequence[int]] = None,
+        time_elapsed_seconds: Optional[Sequence[Optional[float]]] = None,
+        previous_transcripts: Optional[Sequence[Optional[List[str]]]] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Calculate stress scores for many transcripts at once.
+        
+        Keyword matching and repetition checks still run per transcript, but
+        word/exclamation counting, keyword and exclamation density, speaking-rate
+        bucketing and the weighted combination are done as array operations
+        over the whole batch. Results match calculate_stress_score exactly.
+        
+        Args:
+            transcripts: Transcript texts
+            repetition_counts: Repetition count per transcript (default 0)
+            time_elapsed_seconds: Time elapsed per transcript (default None)
+            previous_transcripts: Previous transcripts per transcript (default None)
+        
+        Returns:
+            list: One stress analysis dict per transcript, in input order
+                (same shape as calculate_stress_score)
+        """
+        n = len(transcripts)
+        if n == 0:
+            return []
+        if repetition_counts is None:
+            repetition_counts = [0] * n
+        if time_elapsed_seconds is None:
+            time_elapsed_seconds = [None] * n
+        if previous_transcripts is None:
+            previous_transcripts = [None] * n
+        
+        texts = [unicodedata.normalize("NFC", t) if t and t.strip() else "" for t in transcripts]
+        blank = np.array([not t for t in texts])
+        lowered = [t.lower() for t in texts]
+        words = [t.split() for t in lowered]
+        word_counts = np.array([len(w) for w in words], dtype=np.int64)
+        has_words = word_counts > 0
+        safe_word_counts = np.where(has_words, word_counts, 1)
+        
+        # Component 1: Repetition (per transcript; depends on previous transcripts)
+        repetition_scores = np.array([
+            0.0 if not text else self._calculate_repetition_score(count, previous, current_words)
+            for text, count, previous, current_words in zip(texts, repetition_counts, previous_transcripts, words)
+        ])
+        
+        # Component 2: Panic keyword density
+        panic_keywords_found = [_count_panic_keywords(t) for t in lowered]
+        panic_counts = np.array([sum(found.values()) for found in panic_keywords_found], dtype=np.int64)
+        panic_scores = self._density_scores(panic_counts, safe_word_counts)
+        panic_scores[~has_words] = 0.0
+        
+        # Component 3: Speaking rate
+        elapsed = np.array(
+            [t if t is not None and t > 0 else np.nan for t in time_elapsed_seconds],
+            dtype=np.float64
+        )
+        has_time = ~np.isnan(elapsed)
+        speaking_rates = np.where(has_time, word_counts / np.where(has_time, elapsed, 1.0), 0.0)
+        speaking_rate_scores = np.where(
+            has_time,
+            _RATE_SCORES[np.searchsorted(_RATE_EDGES, speaking_rates, side='left')],
+            np.where(word_counts > 50, 0.3, 0.0)
+        )
+        
+        # Component 4: Exclamation density
+        text_array = np.array(texts, dtype=np.str_)
+        exclamation_counts = np.char.count(text_array, '!')
+        for exclamation in _HINDI_EXCLAMATIONS:
+            exclamation_counts = exclamation_counts + np.char.count(text_array, exclamation)
+        exclamation_counts = np.where(has_words, exclamation_counts, 0)
+        exclamation_scores = self._density_scores(exclamation_counts, safe_word_counts)
+        exclamation_scores[~has_words] = 0.0
+        
+        # Combine components (same weights and summation order as the scalar path)
+        weights = STRESS_COMPONENT_WEIGHTS
+        stress_scores = np.clip(
+            weights["repetition"] * repetition_scores +
+            weights["panic_keywords"] * panic_scores +
+            weights["speaking_rate"] * speaking_rate_scores +
+            weights["exclamation"] * exclamation_scores,
+            0.0, 1.0
+        )
+        
+        # Blank transcripts get the all-zero result
+        for array in (stress_scores, repetition_scores, panic_scores, speaking_rate_scores,
+                      exclamation_scores, speaking_rates):
+            array[blank] = 0.0
+        
+        results = []
+        for i, (stress, rep, panic, rate_score, excl, panic_count, excl_count, word_count, rate) in enumerate(zip(
+            stress_scores.tolist(), repetition_scores.tolist(), panic_scores.tolist(),
+            speaking_rate_scores.tolist(), exclamation_scores.tolist(), panic_counts.tolist(),
+            exclamation_counts.tolist(), word_counts.tolist(), speaking_rates.tolist()
+        )):
+            results.append({
+                "stress_score": stress,
+                "components": {
+                    "repetition_score": rep,
+                    "panic_keyword_score": panic,
+                    "speaking_rate_score": rate_score,
+                    "exclamation_score": excl
+                },
+                "details": {
+                    "panic_keywords_found": dict(panic_keywords_found[i]) if word_count else {},
+                    "panic_keyword_count": panic_count if word_count else 0,
+                    "exclamation_count": excl_count,
+                    "word_count": word_count,
+                    "speaking_rate": rate
+                }
+            })
+        return results
+    
+    @staticmethod
+    def _density_scores(counts: np.ndarray, word_counts: np.ndarray) -> np.ndarray:
+        """
+        Vectorized keyword/exclamation density score (see _calculate_panic_keyword_score).
+        
+        Args:
+            counts: Hit count per transcript
+            word_counts: Word count per transcript (must be non-zero)
+        
+        Returns:
+            np.ndarray: Scores (0.0 to 1.0)
+        """
+        # Hits per 10 words, squashed with frequency / (frequency + 1), in closed form
+        weighted_counts = 10 * counts
+        scores = weighted_counts / (weighted_counts + word_counts)
+        # Boost score if 3+ hits
+        return np.where(counts >= 3, np.minimum(1.0, scores * 1.2), scores)
+    
     def _calculate_repetition_score(
         self,
         repetition_count: int,
         previous_transcripts: Optional[List[str]],
-        current_transcript: str
+        current_words: List[str]
     ) -> float:
         """
         Calculate stress score from repetition.
@@ -182,7 +387,7 @@ class StressEstimator:
         Args:
             repetition_count: Number of times user has repeated content
             previous_transcripts: List of previous transcripts
-            current_transcript: Current transcript
+            current_words: Words of the lowercased current transcript
         
         Returns:
             float: Repetition score (0.0 to 1.0)
@@ -197,62 +402,57 @@ class StressEstimator:
         # Additional score if current transcript is similar to previous ones
         if previous_transcripts and len(previous_transcripts) > 0:
             # Check if current transcript is very similar to any previous transcript
-            current_lower = current_transcript.lower().strip()
+            current_word_set = set(current_words)
+            current_size = len(current_word_set)
             for prev in previous_transcripts[-3:]:  # Check last 3 transcripts
-                prev_lower = prev.lower().strip()
                 # Simple similarity: if transcripts are very similar (80%+ overlap)
-                if len(current_lower) > 0 and len(prev_lower) > 0:
-                    # Calculate simple word overlap
-                    current_words = set(current_lower.split())
-                    prev_words = set(prev_lower.split())
-                    if len(current_words) > 0 and len(prev_words) > 0:
-                        overlap = len(current_words & prev_words) / max(len(current_words), len(prev_words))
-                        if overlap > 0.7:  # 70% word overlap = high similarity
-                            score = max(score, 0.7)
-                            break
+                # Calculate simple word overlap
+                prev_words = _transcript_word_set(prev)
+                prev_size = len(prev_words)
+                if current_size > 0 and prev_size > 0:
+                    # Overlap can never exceed min/max of the set sizes; skip the
+                    # intersection when that bound already rules out a match
+                    if min(current_size, prev_size) / max(current_size, prev_size) <= 0.7:
+                        continue
+                    # No shared word at all: reject without building an intersection set
+                    if current_word_set.isdisjoint(prev_words):
+                        continue
+                    overlap = len(current_word_set & prev_words) / max(current_size, prev_size)
+                    if overlap > 0.7:  # 70% word overlap = high similarity
+                        score = max(score, 0.7)
+                        break
         
         return min(1.0, score)
     
-    def _calculate_panic_keyword_score(self, transcript: str) -> Tuple[float, List[str], int]:
+    def _calculate_panic_keyword_score(self, transcript_lower: str, word_count: int) -> Tuple[float, Dict[str, int], int]:
         """
         Calculate stress score from panic keyword frequency.
         
         Args:
-            transcript: Text to analyze
+            transcript_lower: Lowercased text to analyze
+            word_count: Number of words in the text
         
         Returns:
             tuple: (score, keywords_found, keyword_count)
                 - score: float (0.0 to 1.0)
-                - keywords_found: List of panic keywords found
+                - keywords_found: Hit count per panic keyword found
                 - keyword_count: Total count of panic keywords
         """
-        transcript_lower = transcript.lower()
-        keywords_found = []
-        
-        # Find all panic keywords in transcript
-        for keyword in ALL_PANIC_KEYWORDS:
-            keyword_lower = keyword.lower()
-            # Count occurrences (case-insensitive)
-            count = transcript_lower.count(keyword_lower)
-            if count > 0:
-                keywords_found.extend([keyword] * count)
-        
-        keyword_count = len(keywords_found)
+        # Count panic keyword hits (one entry per distinct keyword, not per hit)
+        keyword_counts = _count_panic_keywords(transcript_lower)
+        keywords_found = dict(keyword_counts)
+        keyword_count = sum(keyword_counts.values())
         
         # Calculate score based on keyword density
         # Normalize by word count to get frequency
-        words = transcript.split()
-        word_count = len(words)
-        
         if word_count == 0:
-            return 0.0, [], 0
+            return 0.0, {}, 0
         
-        # Keyword frequency (keywords per 10 words)
-        keyword_frequency = (keyword_count / word_count) * 10.0
-        
-        # Score: 0 keywords = 0.0, 1+ keywords per 10 words = 1.0
-        # Use sigmoid-like curve: frequency / (frequency + 1)
-        score = min(1.0, keyword_frequency / (keyword_frequency + 1.0))
+        # Keyword frequency f = keywords per 10 words, squashed with the
+        # sigmoid-like curve f / (f + 1); in closed form that is
+        # 10*count / (10*count + word_count), a single division
+        weighted_count = 10 * keyword_count
+        score = weighted_count / (weighted_count + word_count)
         
         # Boost score if multiple keywords found
         if keyword_count >= 3:
@@ -262,34 +462,30 @@ class StressEstimator:
     
     def _calculate_speaking_rate_score(
         self,
-        transcript: str,
+        word_count: int,
         time_elapsed_seconds: Optional[float]
-    ) -> Tuple[float, int, float]:
+    ) -> Tuple[float, float]:
         """
         Calculate stress score from speaking rate (words per second).
         
         Fast speaking indicates stress/panic.
         
         Args:
-            transcript: Text to analyze
+            word_count: Number of words in transcript
             time_elapsed_seconds: Time elapsed since conversation started
         
         Returns:
-            tuple: (score, word_count, speaking_rate)
+            tuple: (score, speaking_rate)
                 - score: float (0.0 to 1.0)
-                - word_count: Number of words in transcript
                 - speaking_rate: Words per second (0.0 if time not available)
         """
-        words = transcript.split()
-        word_count = len(words)
-        
         if time_elapsed_seconds is None or time_elapsed_seconds <= 0:
             # Cannot calculate speaking rate without time
             # Use word count as proxy: very long transcripts might indicate stress
             # But this is less reliable, so give lower score
             if word_count > 50:  # Very long transcript
-                return 0.3, word_count, 0.0
-            return 0.0, word_count, 0.0
+                return 0.3, 0.0
+            return 0.0, 0.0
         
         # Calculate speaking rate (words per second)
         speaking_rate = word_count / time_elapsed_seconds
@@ -305,20 +501,12 @@ class StressEstimator:
         # 4-5 wps = 0.8 (very fast)
         # 5+ wps = 1.0 (extremely fast)
         
-        if speaking_rate <= 2.0:
-            score = 0.0
-        elif speaking_rate <= 3.0:
-            score = 0.3
-        elif speaking_rate <= 4.0:
-            score = 0.6
-        elif speaking_rate <= 5.0:
-            score = 0.8
-        else:
-            score = 1.0
+        # side='left' keeps the upper bound of each bucket inclusive
+        score = float(_RATE_SCORES[np.searchsorted(_RATE_EDGES, speaking_rate, side='left')])
         
-        return score, word_count, speaking_rate
+        return score, speaking_rate
     
-    def _calculate_exclamation_score(self, transcript: str) -> Tuple[float, int]:
+    def _calculate_exclamation_score(self, transcript: str, word_count: int) -> Tuple[float, int]:
         """
         Calculate stress score from exclamation usage.
         
@@ -326,34 +514,30 @@ class StressEstimator:
         
         Args:
             transcript: Text to analyze
+            word_count: Number of words in transcript
         
         Returns:
             tuple: (score, exclamation_count)
                 - score: float (0.0 to 1.0)
                 - exclamation_count: Number of exclamation marks found
         """
-        # Count exclamation marks
-        exclamation_count = transcript.count('!')
-        
-        # Also count Hindi exclamation equivalents (common in Hindi text)
-        # Hindi often uses "!" but also has other patterns
-        hindi_exclamations = ['अरे', 'ओह', 'हाय', 'अरे बाप रे']
-        for exclamation in hindi_exclamations:
-            exclamation_count += transcript.count(exclamation)
+        # Count exclamation marks and Hindi exclamation equivalents (common in
+        # Hindi text) in a single automaton pass when available
+        if _EXCLAMATION_AUTOMATON is not None:
+            exclamation_count = sum(1 for _ in _EXCLAMATION_AUTOMATON.iter(transcript))
+        else:
+            exclamation_count = transcript.count('!')
+            for exclamation in _HINDI_EXCLAMATIONS:
+                exclamation_count += transcript.count(exclamation)
         
         # Normalize by word count
-        words = transcript.split()
-        word_count = len(words)
-        
         if word_count == 0:
             return 0.0, 0
         
-        # Exclamation frequency (exclamations per 10 words)
-        exclamation_frequency = (exclamation_count / word_count) * 10.0
-        
-        # Score: 0 exclamations = 0.0, 1+ per 10 words = 1.0
-        # Use sigmoid-like curve
-        score = min(1.0, exclamation_frequency / (exclamation_frequency + 1.0))
+        # Exclamation frequency f = exclamations per 10 words, squashed with
+        # f / (f + 1) in closed form (see _calculate_panic_keyword_score)
+        weighted_count = 10 * exclamation_count
+        score = weighted_count / (weighted_count + word_count)
         
         # Boost score if multiple exclamations
         if exclamation_count >= 3:
@@ -391,3 +575,32 @@ def estimate_stress(
         previous_transcripts=previous_transcripts
     )
 
+
+def estimate_stress_batch(
+    transcripts: Sequence[str],
+    repetition_counts: Optional[Sequence[int]] = None,
+    time_elapsed_seconds: Optional[Sequence[Optional[float]]] = None,
+    previous_transcripts: Optional[Sequence[Optional[List[str]]]] = None
+) -> List[Dict[str, any]]:
+    """
+    Estimate stress scores for a batch of transcripts.
+    
+    Convenience function that creates a StressEstimator and scores the batch.
+    
+    Args:
+        transcripts: Transcript texts
+        repetition_counts: Repetition count per transcript
+        time_elapsed_seconds: Time elapsed per transcript
+        previous_transcripts: Previous transcripts per transcript
+    
+    Returns:
+        list: Stress analysis per transcript (see StressEstimator.calculate_stress_scores_batch)
+    """
+    estimator = StressEstimator()
+    return estimator.calculate_stress_scores_batch(
+        transcripts=transcripts,
+        repetition_counts=repetition_counts,
+        time_elapsed_seconds=time_elapsed_seconds,
+        previous_transcripts=previous_transcripts
+    )
+
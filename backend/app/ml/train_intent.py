@@ -9,14 +9,17 @@ Usage:
 """
 
 import csv
+import io
 import logging
 import sys
 from pathlib import Path
 from typing import List, Tuple
 
 import numpy as np
-from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
-from sklearn.model_selection import train_test_split
+try:
+    import pandas as pd
+except ImportError:  # Optional: fall back to row-by-row parsing with the csv module
+    pd = None
 
 # Add backend directory to path for imports
 backend_path = Path(__file__).parent.parent.parent
@@ -36,6 +39,21 @@ DATASET_PATH = Path(__file__).parent / "data" / "intent_dataset.csv"
 MODEL_DIR = Path(__file__).parent / "models"
 MODEL_PATH = MODEL_DIR / "intent_classifier.pkl"
 
+# Read buffer for the csv-module dataset loader
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+# Valid labels for O(1) membership checks while loading the dataset
+_VALID_LABELS = frozenset(INTENT_CLASSES)
+
+# Intent class -> row/column index in the confusion matrix
+INTENT_CLASS_INDEX = {cls: i for i, cls in enumerate(INTENT_CLASSES)}
+
+# Integer codes used as the stratification key when splitting. Codes follow
+# sorted class names, the order sklearn derives from string labels, so the
+# split for a given random_seed is the same as stratifying on the strings
+_STRATIFY_CLASSES = sorted(INTENT_CLASSES)
+_STRATIFY_CLASS_INDEX = {cls: i for i, cls in enumerate(_STRATIFY_CLASSES)}
+
 
 def load_dataset(dataset_path: Path) -> Tuple[List[str], List[str]]:
     """
@@ -54,17 +72,79 @@ def load_dataset(dataset_path: Path) -> Tuple[List[str], List[str]]:
     if not dataset_path.exists():
         raise FileNotFoundError(f"Dataset file not found: {dataset_path}")
     
+    logger.info(f"Loading dataset from {dataset_path}")
+    
+    if pd is not None:
+        texts, labels = _read_dataset_pandas(dataset_path)
+    else:
+        texts, labels = _read_dataset_csv(dataset_path)
+    
+    if not texts:
+        raise ValueError("Dataset is empty or contains no valid rows")
+    
+    logger.info(f"Loaded {len(texts)} examples from dataset")
+    
+    # Log class distribution
+    classes, counts = np.unique(np.asarray(labels), return_counts=True)
+    label_counts = dict(zip(classes.tolist(), counts.tolist()))
+    logger.info("Class distribution:")
+    for label in INTENT_CLASSES:
+        count = label_counts.get(label, 0)
+        logger.info(f"  {label}: {count}")
+    
+    return texts, labels
+
+
+def _read_dataset_pandas(dataset_path: Path) -> Tuple[List[str], List[str]]:
+    """
+    Read valid (text, label) rows with pandas' C CSV parser.
+    
+    Stripping and validation are vectorized over whole columns; only the
+    dropped rows are visited in Python, to log why they were skipped.
+    """
+    df = pd.read_csv(dataset_path, dtype=str, keep_default_na=False, encoding='utf-8')
+    for column in ('text', 'label'):
+        if column not in df.columns:
+            df[column] = ''
+    text = df['text'].fillna('').str.strip()
+    label = df['label'].fillna('').str.strip()
+    
+    mask = (text != '') & (label != '') & label.isin(INTENT_CLASSES)
+    
+    dropped = ~mask
+    for row_num, row_text, row_label in zip(df.index[dropped] + 2, text[dropped], label[dropped]):  # Row 1 is header
+        if not row_text:
+            logger.warning(f"Row {row_num}: Empty text, skipping")
+        elif not row_label:
+            logger.warning(f"Row {row_num}: Empty label, skipping")
+        else:
+            logger.warning(f"Row {row_num}: Invalid label '{row_label}', skipping")
+    
+    return text[mask].tolist(), label[mask].tolist()
+
+
+def _read_dataset_csv(dataset_path: Path) -> Tuple[List[str], List[str]]:
+    """
+    Read valid (text, label) rows with csv.reader (used when pandas is not installed).
+    
+    Reads through a large binary buffer and indexes columns by position, so
+    no dict is built per row.
+    """
     texts = []
     labels = []
     
-    logger.info(f"Loading dataset from {dataset_path}")
-    
-    with open(dataset_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(dataset_path, 'rb', buffering=CSV_READ_BUFFER_SIZE) as raw:
+        f = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+        reader = csv.reader(f)
         
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (row 1 is header)
-            text = row.get('text', '').strip()
-            label = row.get('label', '').strip()
+        header = next(reader, [])
+        text_col = header.index('text') if 'text' in header else None
+        label_col = header.index('label') if 'label' in header else None
+        
+        # Blank lines are skipped (and not numbered), as csv.DictReader does
+        for row_num, row in enumerate(filter(None, reader), start=2):  # Start at 2 (row 1 is header)
+            text = row[text_col].strip() if text_col is not None and text_col < len(row) else ''
+            label = row[label_col].strip() if label_col is not None and label_col < len(row) else ''
             
             if not text:
                 logger.warning(f"Row {row_num}: Empty text, skipping")
@@ -74,26 +154,13 @@ def load_dataset(dataset_path: Path) -> Tuple[List[str], List[str]]:
                 logger.warning(f"Row {row_num}: Empty label, skipping")
                 continue
             
-            if label not in INTENT_CLASSES:
+            if label not in _VALID_LABELS:
                 logger.warning(f"Row {row_num}: Invalid label '{label}', skipping")
                 continue
             
             texts.append(text)
             labels.append(label)
     
-    if not texts:
-        raise ValueError("Dataset is empty or contains no valid rows")
-    
-    logger.info(f"Loaded {len(texts)} examples from dataset")
-    
-    # Log class distribution
-    from collections import Counter
-    label_counts = Counter(labels)
-    logger.info("Class distribution:")
-    for label in INTENT_CLASSES:
-        count = label_counts.get(label, 0)
-        logger.info(f"  {label}: {count}")
-    
     return texts, labels
 
 
@@ -110,18 +177,85 @@ def split_train_test(texts: List[str], labels: List[str], test_size: float = 0.2
     Returns:
         tuple: (train_texts, train_labels, test_texts, test_labels)
     """
-    train_texts, test_texts, train_labels, test_labels = train_test_split(
-        texts, labels,
+    from sklearn.model_selection import train_test_split
+    
+    # Stratify on int8 class codes instead of hashing/sorting label strings
+    encoded_labels = np.fromiter(
+        (_STRATIFY_CLASS_INDEX[label] for label in labels), dtype=np.int8, count=len(labels)
+    )
+    train_texts, test_texts, train_encoded, test_encoded = train_test_split(
+        texts, encoded_labels,
         test_size=test_size,
         random_state=random_seed,
-        stratify=labels  # Maintain class distribution
+        stratify=encoded_labels  # Maintain class distribution
     )
+    train_labels = [_STRATIFY_CLASSES[i] for i in train_encoded]
+    test_labels = [_STRATIFY_CLASSES[i] for i in test_encoded]
     
     logger.info(f"Split dataset: {len(train_texts)} train, {len(test_texts)} test")
     
     return train_texts, train_labels, test_texts, test_labels
 
 
+def _confusion_labels(classes: List[str]) -> Tuple[str, Tuple[str, ...]]:
+    """Formatted header line and padded row labels for a confusion matrix over classes."""
+    corner = "Actual \\ Predicted"
+    header = f"{corner:<20}" + "".join(f"{cls[:10]:>12}" for cls in classes)
+    row_labels = tuple(f"{cls[:18]:<20}" for cls in classes)
+    return header, row_labels
+
+
+# Confusion-matrix labels for the fixed intent classes, formatted once
+_INTENT_CLASSES = tuple(INTENT_CLASSES)
+_CONFUSION_HEADER, _CONFUSION_ROW_LABELS = _confusion_labels(_INTENT_CLASSES)
+
+
+def compute_confusion_matrix(y_true: List[str], y_pred: List[str], classes: List[str]) -> np.ndarray:
+    """
+    Compute a confusion matrix with a single bincount.
+    
+    Labels are encoded to class indices once, and each (true, predicted)
+    pair is counted as the flat key len(classes) * true + predicted.
+    Labels not in classes are ignored (as sklearn's confusion_matrix does).
+    
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+        classes: List of class names (matrix row/column order)
+    
+    Returns:
+        np.ndarray: len(classes) x len(classes) matrix; rows are true labels,
+                    columns are predicted labels
+    """
+    class_index = INTENT_CLASS_INDEX if list(classes) == INTENT_CLASSES else {cls: i for i, cls in enumerate(classes)}
+    n_classes = len(classes)
+    
+    true_idx = np.fromiter((class_index.get(label, -1) for label in y_true), dtype=np.int64, count=len(y_true))
+    pred_idx = np.fromiter((class_index.get(label, -1) for label in y_pred), dtype=np.int64, count=len(y_pred))
+    known = (true_idx >= 0) & (pred_idx >= 0)
+    
+    return confusion_counts(true_idx[known], pred_idx[known], n_classes)
+
+
+def confusion_counts(true_idx: np.ndarray, pred_idx: np.ndarray, n_classes: int) -> np.ndarray:
+    """
+    Confusion matrix of already integer-encoded labels.
+    
+    Lets repeated evaluations (e.g. cross-validation folds) encode labels
+    once and only pay for the bincount per call.
+    
+    Args:
+        true_idx: True class indices (0 <= index < n_classes)
+        pred_idx: Predicted class indices (0 <= index < n_classes)
+        n_classes: Number of classes
+    
+    Returns:
+        np.ndarray: n_classes x n_classes int64 matrix (rows true, columns predicted)
+    """
+    counts = np.bincount(n_classes * true_idx + pred_idx, minlength=n_classes * n_classes)
+    return counts.reshape(n_classes, n_classes)
+
+
 def print_confusion_matrix(y_true: List[str], y_pred: List[str], classes: List[str]):
     """
     Print a formatted confusion matrix.
@@ -131,25 +265,33 @@ def print_confusion_matrix(y_true: List[str], y_pred: List[str], classes: List[s
         y_pred: Predicted labels
         classes: List of class names
     """
-    cm = confusion_matrix(y_true, y_pred, labels=classes)
+    _print_confusion_matrix(compute_confusion_matrix(y_true, y_pred, classes), classes)
+
+
+def _print_confusion_matrix(cm: np.ndarray, classes: List[str]):
+    """
+    Print an already computed confusion matrix.
     
+    Args:
+        cm: len(classes) x len(classes) matrix (rows true, columns predicted)
+        classes: List of class names
+    """
     print("\n" + "=" * 80)
     print("CONFUSION MATRIX")
     print("=" * 80)
     
+    if tuple(classes) == _INTENT_CLASSES:
+        header, row_labels = _CONFUSION_HEADER, _CONFUSION_ROW_LABELS
+    else:
+        header, row_labels = _confusion_labels(classes)
+    
     # Print header
-    header = f"{'Actual \\ Predicted':<20}"
-    for cls in classes:
-        header += f"{cls[:10]:>12}"
     print(header)
     print("-" * 80)
     
     # Print rows
-    for i, cls in enumerate(classes):
-        row = f"{cls[:18]:<20}"
-        for j in range(len(classes)):
-            row += f"{cm[i, j]:>12}"
-        print(row)
+    for row_label, counts in zip(row_labels, cm.tolist()):
+        print(row_label + "".join(f"{count:>12}" for count in counts))
     
     print("=" * 80)
     print()
@@ -167,30 +309,49 @@ def evaluate_classifier(classifier: IntentClassifier, test_texts: List[str], tes
     Returns:
         dict: Evaluation metrics
     """
-    logger.info("Evaluating classifier on test set...")
+    from sklearn.metrics import classification_report
     
-    predictions = []
-    confidences = []
+    logger.info("Evaluating classifier on test set...")
     
-    for text in test_texts:
-        result = classifier.predict(text)
-        predictions.append(result['intent'])
-        confidences.append(result['confidence'])
+    if hasattr(classifier, 'predict_batch'):
+        # One batched predict_proba call instead of a predict() per test example
+        results = classifier.predict_batch(test_texts)
+    else:
+        # Classifiers without a batch API: spread per-text predict() calls over
+        # a thread pool (numpy/regex work releases the GIL)
+        from joblib import Parallel, delayed
+        results = Parallel(n_jobs=-1, prefer='threads')(delayed(classifier.predict)(text) for text in test_texts)
+    predictions = [result['intent'] for result in results]
+    confidences = [result['confidence'] for result in results]
+    # Convert once for the summary statistics below
+    confidence_array = np.asarray(confidences)
+    average_confidence = float(confidence_array.mean())
+    
+    # Integer-encode labels once; accuracy, per-class metrics and the confusion
+    # matrix all work on the int8 codes, strings only appear in the printed report
+    n_classes = len(INTENT_CLASSES)
+    true_idx = np.fromiter((INTENT_CLASS_INDEX[label] for label in test_labels), dtype=np.int8, count=len(test_labels))
+    pred_idx = np.fromiter((INTENT_CLASS_INDEX[label] for label in predictions), dtype=np.int8, count=len(predictions))
     
     # Calculate accuracy
-    accuracy = accuracy_score(test_labels, predictions)
+    accuracy = float(np.mean(true_idx == pred_idx))
     
     # Calculate per-class metrics
-    report = classification_report(test_labels, predictions, labels=INTENT_CLASSES, output_dict=True)
+    report = classification_report(
+        true_idx, pred_idx,
+        labels=list(range(n_classes)),
+        target_names=INTENT_CLASSES,
+        output_dict=True
+    )
     
     # Print results
     print("\n" + "=" * 80)
     print("EVALUATION RESULTS")
     print("=" * 80)
     print(f"\nAccuracy: {accuracy:.4f} ({accuracy * 100:.2f}%)")
-    print(f"\nAverage Confidence: {np.mean(confidences):.4f}")
-    print(f"Min Confidence: {np.min(confidences):.4f}")
-    print(f"Max Confidence: {np.max(confidences):.4f}")
+    print(f"\nAverage Confidence: {average_confidence:.4f}")
+    print(f"Min Confidence: {confidence_array.min():.4f}")
+    print(f"Max Confidence: {confidence_array.max():.4f}")
     
     print("\n" + "-" * 80)
     print("PER-CLASS METRICS")
@@ -214,11 +375,11 @@ def evaluate_classifier(classifier: IntentClassifier, test_texts: List[str], tes
           f"{int(report['weighted avg']['support']):<12}")
     
     # Print confusion matrix
-    print_confusion_matrix(test_labels, predictions, INTENT_CLASSES)
+    _print_confusion_matrix(confusion_counts(true_idx.astype(np.int64), pred_idx.astype(np.int64), n_classes), INTENT_CLASSES)
     
     return {
         'accuracy': accuracy,
-        'average_confidence': float(np.mean(confidences)),
+        'average_confidence': average_confidence,
         'classification_report': report,
         'predictions': predictions,
         'confidences': confidences
@@ -14,9 +14,10 @@ All models include:
 - JSON serialization support
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_serializer, field_validator, model_validator
 from typing import Optional, Dict, Any, Literal
 from datetime import datetime
+import time
 from enum import Enum
 
 
@@ -127,35 +128,57 @@ class Incident(BaseModel):
         description="Session identifier for tracking this incident"
     )
     
+    # Both timestamps default to the same clock read (see set_default_timestamps)
     created_at: Optional[datetime] = Field(
-        default_factory=datetime.now,
+        default=None,
         description="Timestamp when incident was first created"
     )
     
     last_updated: Optional[datetime] = Field(
-        default_factory=datetime.now,
+        default=None,
         description="Timestamp when incident was last updated"
     )
     
-    @validator('confidence')
+    @model_validator(mode='before')
+    @classmethod
+    def set_default_timestamps(cls, values):
+        """
+        Default created_at and last_updated to a single shared timestamp.
+        
+        Reads the clock once per construction instead of once per field.
+        Explicitly passed values (including None) are kept.
+        
+        Args:
+            values: Raw input values
+        
+        Returns:
+            dict: Input values with missing timestamps filled in
+        """
+        if isinstance(values, dict) and ('created_at' not in values or 'last_updated' not in values):
+            now = datetime.now()
+            values = dict(values)
+            values.setdefault('created_at', now)
+            values.setdefault('last_updated', now)
+        return values
+    
+    @field_validator('confidence')
+    @classmethod
     def validate_confidence(cls, v):
         """
-        Validate confidence score is within valid range.
+        Round confidence score.
+        
+        The [0.0, 1.0] range is enforced by the field's ge/le constraints.
         
         Args:
             v: Confidence value to validate
         
         Returns:
             float: Validated confidence value
-        
-        Raises:
-            ValueError: If confidence is outside [0.0, 1.0]
         """
-        if not 0.0 <= v <= 1.0:
-            raise ValueError("Confidence must be between 0.0 and 1.0")
         return round(v, 3)  # Round to 3 decimal places
     
-    @validator('location')
+    @field_validator('location')
+    @classmethod
     def validate_location(cls, v):
         """
         Validate and normalize location string.
@@ -174,14 +197,13 @@ class Incident(BaseModel):
             return None
         return v
     
-    class Config:
-        """Pydantic configuration."""
+    model_config = ConfigDict(
         # Use enum values in JSON serialization
-        use_enum_values = True
+        use_enum_values=True,
         # Validate on assignment
-        validate_assignment = True
+        validate_assignment=True,
         # Example values for API documentation
-        schema_extra = {
+        json_schema_extra={
             "example": {
                 "type": "accident",
                 "location": "Delhi, Connaught Place",
@@ -195,6 +217,7 @@ class Incident(BaseModel):
                 "last_updated": "2024-01-01T12:05:00"
             }
         }
+    )
 
 
 class TranscriptUpdate(BaseModel):
@@ -222,9 +245,11 @@ class TranscriptUpdate(BaseModel):
     )
     
     # Timestamp: when this transcript update occurred
-    # Defaults to current time if not provided
-    timestamp: datetime = Field(
-        default_factory=datetime.now,
+    # Defaults to current time if not provided. Stored as epoch seconds (a
+    # plain float is far cheaper to create per message than a datetime) and
+    # serialized as an ISO string
+    timestamp: float = Field(
+        default_factory=time.time,
         description="Timestamp when this transcript update occurred"
     )
     
@@ -256,7 +281,8 @@ class TranscriptUpdate(BaseModel):
         description="Additional metadata (intent, entities, etc.)"
     )
     
-    @validator('text')
+    @field_validator('text')
+    @classmethod
     def validate_text(cls, v):
         """
         Validate and normalize text content.
@@ -274,17 +300,73 @@ class TranscriptUpdate(BaseModel):
             raise ValueError("Text cannot be empty")
         return v.strip()
     
-    @validator('confidence')
-    def validate_confidence(cls, v, values):
+    @classmethod
+    def from_normalized(
+        cls,
+        text: str,
+        speaker: Speaker,
+        **fields: Any
+    ) -> "TranscriptUpdate":
+        """
+        Build a transcript update from trusted, already-normalized input.
+        
+        Skips validation (model_construct), for bulk ingestion where texts
+        were stripped and checked in one vectorized pass beforehand (e.g.
+        pandas Series.str.strip()). Untrusted input must go through the
+        normal constructor so the validators run.
+        
+        Args:
+            text: Non-empty, already stripped text
+            speaker: Speaker (enum or its string value)
+            **fields: Other field values (timestamp as epoch seconds,
+                      session_id, confidence, metadata)
+        
+        Returns:
+            TranscriptUpdate: Unvalidated instance (missing fields get their defaults)
+        """
+        speaker = speaker.value if isinstance(speaker, Speaker) else speaker
+        return cls.model_construct(text=text, speaker=speaker, **fields)
+    
+    @field_validator('timestamp', mode='before')
+    @classmethod
+    def validate_timestamp(cls, v):
+        """
+        Accept datetimes and ISO strings as well as epoch seconds.
+        
+        Args:
+            v: Timestamp value (float/int epoch, datetime, or ISO string)
+        
+        Returns:
+            float or original value: Epoch seconds (other types are left for
+            pydantic's float validation)
+        """
+        if isinstance(v, datetime):
+            return v.timestamp()
+        if isinstance(v, str):
+            try:
+                return datetime.fromisoformat(v).timestamp()
+            except ValueError:
+                return v
+        return v
+    
+    @field_serializer('timestamp', when_used='json')
+    def serialize_timestamp(self, v: float) -> str:
+        """Serialize the epoch timestamp as a local-time ISO string in JSON output."""
+        return datetime.fromtimestamp(v).isoformat()
+    
+    @field_validator('confidence')
+    @classmethod
+    def validate_confidence(cls, v, info: ValidationInfo):
         """
         Validate confidence score.
         
         For AI transcripts, confidence should be None or 1.0.
-        For user transcripts, confidence can be any value in [0.0, 1.0].
+        For user transcripts, confidence can be any value in [0.0, 1.0]
+        (range enforced by the field's ge/le constraints).
         
         Args:
             v: Confidence value to validate
-            values: Other field values (to check speaker)
+            info: Validation info (already-validated fields, to check speaker)
         
         Returns:
             float or None: Validated confidence value
@@ -292,24 +374,21 @@ class TranscriptUpdate(BaseModel):
         if v is None:
             return None
         
-        speaker = values.get('speaker')
+        speaker = info.data.get('speaker')
         if speaker == Speaker.AI and v != 1.0:
             # AI text is always accurate (confidence = 1.0)
             return 1.0
         
-        if not 0.0 <= v <= 1.0:
-            raise ValueError("Confidence must be between 0.0 and 1.0")
-        
         return round(v, 3)  # Round to 3 decimal places
     
-    class Config:
-        """Pydantic configuration."""
+    model_config = ConfigDict(
         # Use enum values in JSON serialization
-        use_enum_values = True
-        # Validate on assignment
-        validate_assignment = True
+        use_enum_values=True,
+        # Transcript updates are immutable messages: build a new instance (e.g.
+        # with model_copy(update=...)) instead of assigning to fields
+        frozen=True,
         # Example values for API documentation
-        schema_extra = {
+        json_schema_extra={
             "example": {
                 "text": "मेरा नाम राम है, दिल्ली में दुर्घटना हुई",
                 "timestamp": "2024-01-01T12:00:00",
@@ -325,6 +404,7 @@ class TranscriptUpdate(BaseModel):
                 }
             }
         }
+    )
 
 
 # Legacy models for backward compatibility
@@ -13,12 +13,25 @@ Extracts:
 
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from enum import Enum
 
+from app.nlp.keyword_automaton import build_automaton, present_keywords
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Normalized texts whose extracted entities are kept by _extract_entities_cached
+ENTITY_CACHE_SIZE = 4096
+
+# Joins batched transcripts for a single automaton pass; it is whitespace, so
+# normalize_text never leaves one in a text (and no keyword contains one)
+_BATCH_SEPARATOR = "\x1f"
+
 
 class UrgencyLevel(Enum):
     """Urgency levels for incidents."""
@@ -213,6 +226,186 @@ COMMON_NAMES = [
 ]
 
 
+def _lowercase_keywords(weights: Dict[str, float]) -> Dict[str, float]:
+    """
+    Lowercase keyword keys, keeping the highest weight when two collide.
+    
+    Args:
+        weights: Mapping of keyword to weight
+    
+    Returns:
+        dict: Lowercased keyword to weight, in first-seen order
+    """
+    lowered = {}
+    for keyword, weight in weights.items():
+        key = keyword.lower()
+        lowered[key] = max(weight, lowered.get(key, weight))
+    return lowered
+
+
+# normalize_text lowercases every transcript, so the keywords are lowercased
+# once here and all patterns below can match case-sensitively
+LOCATION_KEYWORDS = _lowercase_keywords(LOCATION_KEYWORDS)
+URGENCY_KEYWORDS = {level: _lowercase_keywords(keywords) for level, keywords in URGENCY_KEYWORDS.items()}
+COMMON_NAMES = list(dict.fromkeys(name.lower() for name in COMMON_NAMES))
+
+
+def _present_keywords_batch(automaton, keywords, texts: List[str]) -> List[set]:
+    """
+    Return present_keywords for each text using one automaton pass.
+    
+    The texts are joined with a separator no keyword contains, and each hit
+    is assigned back to its text by offset.
+    
+    Args:
+        automaton: Automaton from build_automaton, or None
+        keywords: Keywords the automaton was built from
+        texts: Normalized (lowercased) texts
+    
+    Returns:
+        List[set]: Keywords found in each text, in input order
+    """
+    if automaton is None:
+        return [present_keywords(None, keywords, text) for text in texts]
+    
+    # Offset of the separator after each text: a hit ending before
+    # text_ends[i] (and after text_ends[i - 1]) belongs to text i
+    text_ends = []
+    offset = 0
+    for text in texts:
+        offset += len(text)
+        text_ends.append(offset)
+        offset += len(_BATCH_SEPARATOR)
+    
+    hits = [set() for _ in texts]
+    for end_index, keyword in automaton.iter(_BATCH_SEPARATOR.join(texts)):
+        hits[bisect_right(text_ends, end_index)].add(keyword)
+    return hits
+
+
+# pattern -> incident type, so one pass over the hits tallies every type
+_INCIDENT_KEYWORD_TYPES = {
+    pattern: inc_type
+    for inc_type, patterns in INCIDENT_TYPE_PATTERNS.items()
+    for pattern in patterns
+}
+_INCIDENT_KEYWORDS = list(_INCIDENT_KEYWORD_TYPES)
+# Flat (keyword, level value, weight) entries in URGENCY_KEYWORDS order; a
+# keyword listed under several levels (e.g. "तुरंत") appears once per level
+_URGENCY_ENTRIES = [
+    (keyword, level.value, weight)
+    for level, keywords in URGENCY_KEYWORDS.items()
+    for keyword, weight in keywords.items()
+]
+_URGENCY_KEYWORD_SET = {keyword for keyword, _, _ in _URGENCY_ENTRIES}
+# Urgency reported when no indicator is found
+_DEFAULT_URGENCY = UrgencyLevel.MEDIUM.value
+
+# One automaton per keyword category, built once at import. present_keywords
+# is a prefilter: the per-keyword regexes only run for keywords that occur
+_LOCATION_AUTOMATON = build_automaton(LOCATION_KEYWORDS)
+_URGENCY_AUTOMATON = build_automaton(_URGENCY_KEYWORD_SET)
+_INCIDENT_AUTOMATON = build_automaton(_INCIDENT_KEYWORDS)
+
+# Regexes compiled once at import instead of being rebuilt on every call
+# Any letter in any script; every keyword, name and pattern needs at least one
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+_NAME_PATTERNS = [
+    re.compile(rf"{indicator}\s+([\u0900-\u097F\w]+(?:\s+[\u0900-\u097F\w]+)?)", re.UNICODE)
+    for indicator in NAME_INDICATORS
+]
+# All common names in one scan. The lookahead reports a match at every
+# position (overlaps included) so the earliest name in COMMON_NAMES can win,
+# as it did with one search per name. Text is lowercased by normalize_text.
+_COMMON_NAMES_RE = re.compile(r"(?=\b(" + "|".join(COMMON_NAMES) + r")\b)")
+_COMMON_NAME_RANK = {name: rank for rank, name in enumerate(COMMON_NAMES)}
+# Display forms computed once ("rahul" -> "Rahul"; Devanagari is unchanged)
+_COMMON_NAME_TITLES = {name: name.title() for name in COMMON_NAMES}
+
+# Whitespace-delimited tokens of 2-15 letters: candidate names for the
+# word-analysis fallback (isalpha() still confirms each candidate)
+_CANDIDATE_NAME_RE = re.compile(r"(?<!\S)[^\W\d_]{2,15}(?!\S)")
+_NAME_STOPWORDS = frozenset(["मैं", "तुम", "वह", "यह", "i", "you", "he", "she", "it"])
+# Words an indicator pattern may capture that are never names
+_NAME_FILLER_WORDS = frozenset(["is", "am", "are", "the", "a", "an"])
+
+# keyword -> "keyword followed by a location" pattern
+_LOCATION_KEYWORD_PATTERNS = {
+    keyword: re.compile(rf"{re.escape(keyword)}\s+([\u0900-\u097F\w\s]+?)(?:\s|$|,|\.|!|\?)", re.UNICODE)
+    for keyword in LOCATION_KEYWORDS
+}
+# High-weight (city/place) keywords matched as whole words
+_LOCATION_NAME_PATTERNS = {
+    keyword: re.compile(rf"\b{re.escape(keyword)}\b")
+    for keyword, weight in LOCATION_KEYWORDS.items()
+    if weight >= 0.8
+}
+_LOCATION_NAME_TITLES = {keyword: keyword.title() for keyword in _LOCATION_NAME_PATTERNS}
+
+# Up to four whole words directly before a location suffix. An unbounded
+# lazy "[\w\s]+?" capture here retries from every start position and goes
+# quadratic on long transcripts with no suffix in them.
+_PLACE_WORDS = r"(?<![\u0900-\u097F\w])([\u0900-\u097F\w]+(?:\s+[\u0900-\u097F\w]+){0,3}?)"
+
+# Common location patterns: "X road", "railway station X", "at X station", ...
+# Each entry is (pattern, required literals). Patterns that open with a
+# capture have no literal prefix for the regex engine to seek to and try
+# every position, so they only run when one of their literals is present.
+_LOCATION_SUFFIXES = ("road", "street", "lane", "avenue", "market", "bazar", "station", "मार्केट", "बाजार", "सड़क", "रोड", "स्टेशन")
+_RAILWAY_WORDS = ("railway", "रेलवे")
+_LOCATION_PATTERNS = [
+    (re.compile(pattern, re.UNICODE), required)
+    for pattern, required in (
+        (_PLACE_WORDS + r"\s+(road|street|lane|avenue|market|bazar|station|मार्केट|बाजार|सड़क|रोड|स्टेशन)", _LOCATION_SUFFIXES),
+        (r"(road|street|lane|avenue|market|bazar|station|railway station|मार्केट|बाजार|सड़क|रोड|स्टेशन|रेलवे स्टेशन)\s+([\u0900-\u097F\w\s]+?)", ()),
+        (r"(railway|रेलवे)\s+(station|स्टेशन)\s+([\u0900-\u097F\w\s]+?)", ()),  # "railway station New Delhi"
+        (_PLACE_WORDS + r"\s+(railway|रेलवे)\s+(station|स्टेशन)", _RAILWAY_WORDS),  # "New Delhi railway station"
+        (r"(at|in|near|beside|behind|in front of)\s+([\u0900-\u097F\w\s]+?)\s+(railway|रेलवे)?\s*(station|स्टेशन)?", ()),  # "at New Delhi railway station"
+        (r"(railway|रेलवे)\s+(station|स्टेशन)\s+(of|in|at)?\s*([\u0900-\u097F\w\s]+?)", ()),  # "railway station of New Delhi"
+    )
+]
+# Words a keyword capture may pick up that are never locations
+_LOCATION_FILLER_WORDS = frozenset(["the", "a", "an", "is", "are", "was", "were"])
+_LOCATION_SKIP_WORDS = frozenset([
+    "road", "street", "lane", "avenue", "market", "bazar", "station", "railway",
+    "मार्केट", "बाजार", "सड़क", "रोड", "स्टेशन", "रेलवे", "रेलवे स्टेशन",
+])
+
+# keyword -> whole-word pattern, shared by all urgency levels.
+# A leading \b stops re from skipping ahead to the keyword literal, so these
+# and _LOCATION_NAME_PATTERNS are searched from the keyword's str.find offset.
+_URGENCY_PATTERNS = {
+    keyword: re.compile(rf"\b{re.escape(keyword)}\b")
+    for keyword in _URGENCY_KEYWORD_SET
+}
+
+
+def _freeze_result(entities: Dict[str, any], confidence: Dict[str, float]) -> Mapping[str, Mapping[str, any]]:
+    """Wrap an extraction result in read-only views so it can be shared between callers."""
+    return MappingProxyType({
+        "entities": MappingProxyType(entities),
+        "confidence": MappingProxyType(confidence)
+    })
+
+
+# Shared result for empty or letter-free input
+_EMPTY_RESULT = _freeze_result(
+    {
+        "name": None,
+        "location": None,
+        "incident_type": None,
+        "urgency": _DEFAULT_URGENCY
+    },
+    {
+        "name": 0.0,
+        "location": 0.0,
+        "incident_type": 0.0,
+        "urgency": 0.3
+    }
+)
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text for entity extraction.
@@ -231,11 +424,9 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
     
-    text = text.lower()
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    
-    return text
+    # split() drops leading/trailing whitespace and collapses runs of any
+    # Unicode whitespace, exactly like re.sub(r'\s+', ' ', ...).strip()
+    return ' '.join(text.lower().split())
 
 
 def extract_name(text: str) -> Tuple[Optional[str], float]:
@@ -257,22 +448,25 @@ def extract_name(text: str) -> Tuple[Optional[str], float]:
     if not text:
         return None, 0.0
     
-    normalized = normalize_text(text)
+    return _extract_name_from_normalized(normalize_text(text))
+
+
+def _extract_name_from_normalized(normalized: str) -> Tuple[Optional[str], float]:
+    """Extract a person name from text already passed through normalize_text."""
     name = None
     confidence = 0.0
     
     # Pattern 1: Explicit name indicators
     # "मेरा नाम X है" or "name is X" or "my name is X" or "I am X"
     # Support both Hindi and English names in English transcripts
-    for indicator in NAME_INDICATORS:
+    for pattern in _NAME_PATTERNS:
         # Pattern for Hindi/English names: allow Unicode characters (Hindi) and ASCII
         # Handle English transcripts: "my name is Rahul" or "I am Rahul"
-        pattern = rf"{indicator}\s+([\u0900-\u097F\w]+(?:\s+[\u0900-\u097F\w]+)?)"
-        match = re.search(pattern, normalized, re.IGNORECASE | re.UNICODE)
+        match = pattern.search(normalized)
         if match:
             potential_name = match.group(1).strip()
             # Filter out common words that might be captured
-            if len(potential_name) > 1 and potential_name.lower() not in ["is", "am", "are", "the", "a", "an"]:
+            if len(potential_name) > 1 and potential_name not in _NAME_FILLER_WORDS:
                 name = potential_name  # Keep original case/script
                 confidence = 0.9
                 logger.debug(f"Name extracted via indicator: {name}")
@@ -280,23 +474,22 @@ def extract_name(text: str) -> Tuple[Optional[str], float]:
     
     # Pattern 2: Common name patterns
     # Look for known common names in text
-    for name_pattern in COMMON_NAMES:
-        match = re.search(rf"\b{name_pattern}\b", normalized, re.IGNORECASE)
-        if match:
-            potential_name = match.group(0).strip()
-            name = potential_name.title()
-            confidence = 0.7  # Lower confidence for pattern matching
-            logger.debug(f"Name extracted via pattern: {name}")
-            return name, confidence
+    found = [match.group(1) for match in _COMMON_NAMES_RE.finditer(normalized)]
+    if found:
+        potential_name = min(found, key=_COMMON_NAME_RANK.__getitem__)
+        name = _COMMON_NAME_TITLES[potential_name]
+        confidence = 0.7  # Lower confidence for pattern matching
+        logger.debug(f"Name extracted via pattern: {name}")
+        return name, confidence
     
     # Pattern 3: Capitalized words (potential names)
     # In emotional speech, names might be mentioned without indicators
-    words = normalized.split()
-    for i, word in enumerate(words):
-        # Check if word looks like a name (2-15 chars, mostly letters)
-        if 2 <= len(word) <= 15 and word.isalpha():
+    for match in _CANDIDATE_NAME_RE.finditer(normalized):
+        word = match.group(0)
+        # Check if word looks like a name (2-15 chars, all letters)
+        if word.isalpha():
             # Check if it's not a common word
-            if word not in ["मैं", "तुम", "वह", "यह", "i", "you", "he", "she", "it"]:
+            if word not in _NAME_STOPWORDS:
                 name = word.title()
                 confidence = 0.5  # Low confidence for vague extraction
                 logger.debug(f"Name extracted via word analysis: {name}")
@@ -324,23 +517,30 @@ def extract_location(text: str) -> Tuple[Optional[str], float]:
     if not text:
         return None, 0.0
     
-    normalized = normalize_text(text)
+    return _extract_location_from_normalized(normalize_text(text))
+
+
+def _extract_location_from_normalized(normalized: str, present: Optional[set] = None) -> Tuple[Optional[str], float]:
+    """Extract a location from text already passed through normalize_text (keyword hits may be precomputed)."""
     location = None
     confidence = 0.0
+    if present is None:
+        present = present_keywords(_LOCATION_AUTOMATON, LOCATION_KEYWORDS, normalized)
     
     # Pattern 1: Location keywords with following text
     # "में X", "near X", "at X", "in X", "at railway station X"
     # Support both Hindi and English location names
     # Handle English transcripts with Hindi words mixed in
     for keyword, weight in LOCATION_KEYWORDS.items():
+        if keyword not in present:
+            continue
         # Pattern: keyword followed by location name (Hindi Unicode + English + spaces)
         # More flexible pattern to capture locations in English transcripts
-        pattern = rf"{re.escape(keyword)}\s+([\u0900-\u097F\w\s]+?)(?:\s|$|,|\.|!|\?)"
-        match = re.search(pattern, normalized, re.IGNORECASE | re.UNICODE)
+        match = _LOCATION_KEYWORD_PATTERNS[keyword].search(normalized)
         if match:
             potential_location = match.group(1).strip()
             # Filter out very short or common words
-            if len(potential_location) > 2 and potential_location.lower() not in ["the", "a", "an", "is", "are", "was", "were"]:
+            if len(potential_location) > 2 and potential_location not in _LOCATION_FILLER_WORDS:
                 location = potential_location  # Keep original case/script
                 confidence = weight
                 logger.debug(f"Location extracted via keyword '{keyword}': {location}")
@@ -348,41 +548,30 @@ def extract_location(text: str) -> Tuple[Optional[str], float]:
     
     # Pattern 2: Known location names
     # Check if text contains known city/place names
-    for loc_name, weight in LOCATION_KEYWORDS.items():
-        if weight >= 0.8:  # High-weight locations (cities)
-            pattern = rf"\b{re.escape(loc_name)}\b"
-            if re.search(pattern, normalized, re.IGNORECASE):
-                location = loc_name.title()
-                confidence = weight
+    for loc_name, pattern in _LOCATION_NAME_PATTERNS.items():
+        if loc_name in present:  # High-weight locations (cities)
+            if pattern.search(normalized, normalized.find(loc_name)):
+                location = _LOCATION_NAME_TITLES[loc_name]
+                confidence = LOCATION_KEYWORDS[loc_name]
                 logger.debug(f"Location extracted via known name: {location}")
                 return location, confidence
     
     # Pattern 3: Common location patterns
     # "X road", "X street", "X market", "railway station X", "X station"
     # Handle English transcripts with location names
-    location_patterns = [
-        r"([\u0900-\u097F\w\s]+?)\s+(road|street|lane|avenue|market|bazar|station|मार्केट|बाजार|सड़क|रोड|स्टेशन)",
-        r"(road|street|lane|avenue|market|bazar|station|railway station|मार्केट|बाजार|सड़क|रोड|स्टेशन|रेलवे स्टेशन)\s+([\u0900-\u097F\w\s]+?)",
-        r"(railway|रेलवे)\s+(station|स्टेशन)\s+([\u0900-\u097F\w\s]+?)",  # "railway station New Delhi"
-        r"([\u0900-\u097F\w\s]+?)\s+(railway|रेलवे)\s+(station|स्टेशन)",  # "New Delhi railway station"
-        r"(at|in|near|beside|behind|in front of)\s+([\u0900-\u097F\w\s]+?)\s+(railway|रेलवे)?\s*(station|स्टेशन)?",  # "at New Delhi railway station"
-        r"(railway|रेलवे)\s+(station|स्टेशन)\s+(of|in|at)?\s*([\u0900-\u097F\w\s]+?)",  # "railway station of New Delhi"
-    ]
-    
-    for pattern in location_patterns:
-        match = re.search(pattern, normalized, re.IGNORECASE | re.UNICODE)
+    for pattern, required in _LOCATION_PATTERNS:
+        if required and not any(literal in normalized for literal in required):
+            continue
+        match = pattern.search(normalized)
         if match:
             # Handle different group positions (some patterns have location in group 1, others in group 2 or 3)
             potential_location = None
-            skip_words = ["road", "street", "lane", "avenue", "market", "bazar", "station", "railway", "मार्केट", "बाजार", "सड़क", "रोड", "स्टेशन", "रेलवे", "रेलवे स्टेशन"]
-            for i in range(1, len(match.groups()) + 1):
-                group = match.group(i)
-                if group and group.strip() and group.strip().lower() not in [w.lower() for w in skip_words]:
-                    # Check if it's a meaningful location (not just a single common word)
-                    words = group.strip().split()
-                    if len(words) > 0:
-                        potential_location = group.strip()
-                        break
+            for group in match.groups():
+                group = group.strip() if group else None
+                # Check if it's a meaningful location (not just a single common word)
+                if group and group not in _LOCATION_SKIP_WORDS:
+                    potential_location = group
+                    break
             
             if potential_location and len(potential_location) > 1:
                 location = potential_location  # Keep original case/script
@@ -411,19 +600,20 @@ def extract_incident_type(text: str) -> Tuple[Optional[str], float]:
     if not text:
         return None, 0.0
     
-    normalized = normalize_text(text)
+    return _extract_incident_type_from_normalized(normalize_text(text))
+
+
+def _extract_incident_type_from_normalized(normalized: str, present: Optional[set] = None) -> Tuple[Optional[str], float]:
+    """Extract the incident type from text already passed through normalize_text (keyword hits may be precomputed)."""
     incident_type = None
     max_confidence = 0.0
+    if present is None:
+        present = present_keywords(_INCIDENT_AUTOMATON, _INCIDENT_KEYWORDS, normalized)
+    type_counts = Counter(_INCIDENT_KEYWORD_TYPES[pattern] for pattern in present)
     
     # Check each incident type pattern
-    for inc_type, patterns in INCIDENT_TYPE_PATTERNS.items():
-        if not patterns:
-            continue
-        
-        matches = 0
-        for pattern in patterns:
-            if re.search(pattern, normalized, re.IGNORECASE):
-                matches += 1
+    for inc_type in INCIDENT_TYPE_PATTERNS:
+        matches = type_counts[inc_type]
         
         if matches > 0:
             # Confidence based on number of matches
@@ -454,39 +644,47 @@ def extract_urgency(text: str) -> Tuple[Optional[str], float]:
     if not text:
         return None, 0.0
     
-    normalized = normalize_text(text)
+    return _extract_urgency_from_normalized(normalize_text(text))
+
+
+def _extract_urgency_from_normalized(normalized: str, present: Optional[set] = None) -> Tuple[Optional[str], float]:
+    """Extract the urgency level from text already passed through normalize_text (keyword hits may be precomputed)."""
     urgency = None
     max_confidence = 0.0
+    if present is None:
+        present = present_keywords(_URGENCY_AUTOMATON, _URGENCY_KEYWORD_SET, normalized)
+    # Whole-word check once per keyword, however many levels list it
+    matched = {
+        keyword for keyword in present
+        if _URGENCY_PATTERNS[keyword].search(normalized, normalized.find(keyword))
+    }
+    
+    # Accumulate (total weight, match count) per level in one pass
+    level_scores = {}
+    if matched:
+        for keyword, level, weight in _URGENCY_ENTRIES:
+            if keyword in matched:
+                total_score, matches = level_scores.get(level, (0.0, 0))
+                level_scores[level] = (total_score + weight, matches + 1)
     
     # Check each urgency level
-    for level, keywords in URGENCY_KEYWORDS.items():
-        total_score = 0.0
-        matches = 0
-        
-        for keyword, weight in keywords.items():
-            # Check for keyword in text
-            pattern = rf"\b{re.escape(keyword)}\b"
-            if re.search(pattern, normalized, re.IGNORECASE):
-                total_score += weight
-                matches += 1
-        
-        if matches > 0:
-            # Calculate confidence (average weight, boosted by multiple matches)
-            confidence = min((total_score / matches) + (matches * 0.1), 1.0)
-            if confidence > max_confidence:
-                max_confidence = confidence
-                urgency = level.value
-                logger.debug(f"Urgency extracted: {urgency} (confidence: {confidence})")
+    for level, (total_score, matches) in level_scores.items():
+        # Calculate confidence (average weight, boosted by multiple matches)
+        confidence = min((total_score / matches) + (matches * 0.1), 1.0)
+        if confidence > max_confidence:
+            max_confidence = confidence
+            urgency = level
+            logger.debug(f"Urgency extracted: {urgency} (confidence: {confidence})")
     
     # Default to MEDIUM if no urgency indicators found
     if urgency is None:
-        urgency = UrgencyLevel.MEDIUM.value
+        urgency = _DEFAULT_URGENCY
         max_confidence = 0.3  # Low confidence for default
     
     return urgency, max_confidence
 
 
-def extract_entities(text: str) -> Dict[str, any]:
+def extract_entities(text: str, copy: bool = True) -> Dict[str, any]:
     """
     Extract all entities from text.
     
@@ -501,8 +699,14 @@ def extract_entities(text: str) -> Dict[str, any]:
     - Fragmented text from streaming audio
     - Hindi/Hinglish code-switching
     
+    Results are cached on the normalized text, so repeated partial
+    transcripts are only extracted once.
+    
     Args:
         text: Input text (may be fragmented, vague, or emotional)
+        copy: Return plain dicts the caller may mutate. Read-only callers
+            can pass False to get the shared, read-only result without
+            copying it.
     
     Returns:
         dict: JSON with keys:
@@ -534,52 +738,122 @@ def extract_entities(text: str) -> Dict[str, any]:
             }
         }
     """
-    if not text or not text.strip():
-        # Return empty entities with low confidence
-        return {
-            "entities": {
-                "name": None,
-                "location": None,
-                "incident_type": None,
-                "urgency": UrgencyLevel.MEDIUM.value
-            },
-            "confidence": {
-                "name": 0.0,
-                "location": 0.0,
-                "incident_type": 0.0,
-                "urgency": 0.3
-            }
-        }
+    normalized = normalize_text(text)
+    if not normalized or not _LETTER_RE.search(normalized):
+        # Empty or letter-free input (e.g. "...", "?" or digits from interim
+        # ASR hypotheses) cannot match anything: return empty entities
+        result = _EMPTY_RESULT
+    else:
+        logger.debug(f"Extracting entities from text: {text[:100]}...")
+        result = _extract_entities_cached(normalized)
+        entities = result["entities"]
+        
+        # Log extraction results
+        logger.info(
+            f"Entities extracted - name: {entities['name']}, location: {entities['location']}, "
+            f"incident_type: {entities['incident_type']}, urgency: {entities['urgency']}"
+        )
+    
+    if not copy:
+        return result
+    
+    # Fresh dicts the caller may mutate without touching the shared result
+    return {
+        "entities": dict(result["entities"]),
+        "confidence": dict(result["confidence"])
+    }
+
+
+@lru_cache(maxsize=ENTITY_CACHE_SIZE)
+def _extract_entities_cached(normalized: str) -> Mapping[str, Mapping[str, any]]:
+    """
+    Extract all entities from already-normalized text (memoized).
     
-    logger.debug(f"Extracting entities from text: {text[:100]}...")
+    Args:
+        normalized: Non-empty output of normalize_text
     
+    Returns:
+        Mapping: Read-only view with the same structure as extract_entities
+    """
+    return _extract_entities_from_normalized(normalized)
+
+
+def _extract_entities_from_normalized(
+    normalized: str,
+    location_hits: Optional[set] = None,
+    incident_hits: Optional[set] = None,
+    urgency_hits: Optional[set] = None
+) -> Mapping[str, Mapping[str, any]]:
+    """
+    Extract all entities from already-normalized text.
+    
+    Args:
+        normalized: Non-empty output of normalize_text
+        location_hits: Precomputed location keyword hits, if any
+        incident_hits: Precomputed incident keyword hits, if any
+        urgency_hits: Precomputed urgency keyword hits, if any
+    
+    Returns:
+        Mapping: Read-only view with the same structure as extract_entities
+    """
     # Extract each entity type
-    name, name_confidence = extract_name(text)
-    location, location_confidence = extract_location(text)
-    incident_type, incident_confidence = extract_incident_type(text)
-    urgency, urgency_confidence = extract_urgency(text)
+    name, name_confidence = _extract_name_from_normalized(normalized)
+    location, location_confidence = _extract_location_from_normalized(normalized, location_hits)
+    incident_type, incident_confidence = _extract_incident_type_from_normalized(normalized, incident_hits)
+    urgency, urgency_confidence = _extract_urgency_from_normalized(normalized, urgency_hits)
     
     # Build result dictionary
-    result = {
-        "entities": {
+    return _freeze_result(
+        {
             "name": name,
             "location": location,
             "incident_type": incident_type,
             "urgency": urgency
         },
-        "confidence": {
+        {
             "name": round(float(name_confidence), 3),
             "location": round(float(location_confidence), 3),
             "incident_type": round(float(incident_confidence), 3),
             "urgency": round(float(urgency_confidence), 3)
         }
-    }
-    
-    # Log extraction results
-    logger.info(
-        f"Entities extracted - name: {name}, location: {location}, "
-        f"incident_type: {incident_type}, urgency: {urgency}"
     )
-    
-    return result
 
+
+def extract_entities_batch(texts: List[str]) -> List[Dict[str, any]]:
+    """
+    Extract entities from many transcripts at once.
+    
+    Equivalent to [extract_entities(text) for text in texts], but each keyword
+    automaton makes a single pass over all the texts, and a text repeated in
+    the batch is only extracted once.
+    
+    Args:
+        texts: Input texts (e.g. buffered ASR partials)
+    
+    Returns:
+        List[dict]: One extract_entities result per input text, in order
+    """
+    normalized_texts = [normalize_text(text) for text in texts]
+    
+    # Unique texts that need extraction, in first-seen order
+    pending = list(dict.fromkeys(
+        normalized for normalized in normalized_texts
+        if normalized and _LETTER_RE.search(normalized)
+    ))
+    location_hits = _present_keywords_batch(_LOCATION_AUTOMATON, LOCATION_KEYWORDS, pending)
+    incident_hits = _present_keywords_batch(_INCIDENT_AUTOMATON, _INCIDENT_KEYWORDS, pending)
+    urgency_hits = _present_keywords_batch(_URGENCY_AUTOMATON, _URGENCY_KEYWORD_SET, pending)
+    
+    results = {
+        normalized: _extract_entities_from_normalized(normalized, location, incident, urgency)
+        for normalized, location, incident, urgency in zip(pending, location_hits, incident_hits, urgency_hits)
+    }
+    logger.debug(f"Extracted entities for {len(texts)} texts ({len(pending)} unique)")
+    
+    return [
+        {
+            "entities": dict(result["entities"]),
+            "confidence": dict(result["confidence"])
+        }
+        for result in (results.get(normalized, _EMPTY_RESULT) for normalized in normalized_texts)
+    ]
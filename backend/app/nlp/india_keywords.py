@@ -11,9 +11,14 @@ Used for:
 4. Recruiter-visible "India-aware design"
 """
 
-from typing import Dict, List, Set
+import re
+import sys
+from collections import Counter
+from typing import Dict, FrozenSet, List
 from enum import Enum
 
+from app.nlp.keyword_automaton import build_automaton, present_keywords
+
 
 class IncidentCategory(Enum):
     """Standard incident categories."""
@@ -30,7 +35,7 @@ class IncidentCategory(Enum):
 
 
 # 🔴 1. MEDICAL EMERGENCY
-MEDICAL_KEYWORDS = {
+MEDICAL_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "saans nahi aa rahi", "saans nahi aa raha", "breathing problem", "breathing nahi ho rahi",
     "behosh ho gaya", "behosh ho gayi", "behosh", "unconscious",
@@ -51,10 +56,10 @@ MEDICAL_KEYWORDS = {
     # English
     "unconscious", "severe pain", "medical emergency", "critical condition",
     "patient serious", "emergency medical", "ambulance needed", "hospital needed"
-}
+})
 
 # 🚗 2. ROAD ACCIDENT
-ROAD_ACCIDENT_KEYWORDS = {
+ROAD_ACCIDENT_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "accident ho gaya", "accident", "gaadi takra gayi", "car accident",
     "bike slip ho gayi", "bike accident", "motorcycle accident",
@@ -67,10 +72,10 @@ ROAD_ACCIDENT_KEYWORDS = {
     # English
     "road accident", "collision", "hit and run", "injured badly",
     "car crash", "vehicle accident", "traffic accident"
-}
+})
 
 # 🔥 3. FIRE EMERGENCY
-FIRE_KEYWORDS = {
+FIRE_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "aag lag gayi", "aag", "fire lag gaya", "fire",
     "gas cylinder blast", "cylinder phat gaya", "cylinder blast", "gas blast",
@@ -82,10 +87,10 @@ FIRE_KEYWORDS = {
     # English
     "fire outbreak", "building on fire", "explosion", "smoke everywhere",
     "fire emergency", "burning"
-}
+})
 
 # 🚨 4. CRIME / VIOLENCE
-CRIME_KEYWORDS = {
+CRIME_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "chori ho gayi", "chori", "theft", "robbery",
     "loot liya", "loot", "robbery",
@@ -101,10 +106,10 @@ CRIME_KEYWORDS = {
     # English
     "attack", "violence", "threat", "weapon involved",
     "crime", "criminal", "robbery", "theft"
-}
+})
 
 # 🏠 5. DOMESTIC VIOLENCE / FAMILY EMERGENCY
-DOMESTIC_KEYWORDS = {
+DOMESTIC_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "ghar mein jhagda", "domestic fight", "family fight",
     "husband maar raha hai", "pati maar raha hai", "husband beating",
@@ -116,10 +121,10 @@ DOMESTIC_KEYWORDS = {
     "children crying", "bachche danger mein hain", "children in danger",
     # English
     "domestic violence", "family emergency", "abuse", "child abuse"
-}
+})
 
 # 🌊 6. NATURAL DISASTER / WEATHER
-NATURAL_DISASTER_KEYWORDS = {
+NATURAL_DISASTER_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "flood aa gaya", "flood", "paani bhar gaya", "water flooding",
     "ghar doob gaya", "house flooded", "drowning",
@@ -131,10 +136,10 @@ NATURAL_DISASTER_KEYWORDS = {
     "heat stroke", "loo lag gayi", "heat wave",
     # English
     "natural disaster", "flood", "earthquake", "storm", "cyclone"
-}
+})
 
 # 🏭 7. INDUSTRIAL / WORKPLACE ACCIDENT
-INDUSTRIAL_KEYWORDS = {
+INDUSTRIAL_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "factory accident", "factory mein accident",
     "machine mein haath aa gaya", "machine accident", "machine injury",
@@ -145,10 +150,10 @@ INDUSTRIAL_KEYWORDS = {
     "building gir gayi", "building collapse",
     # English
     "industrial accident", "workplace accident", "factory accident"
-}
+})
 
 # 🚆 8. PUBLIC TRANSPORT INCIDENT
-PUBLIC_TRANSPORT_KEYWORDS = {
+PUBLIC_TRANSPORT_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "train accident", "train mein accident",
     "platform pe gir gaya", "platform accident",
@@ -158,10 +163,10 @@ PUBLIC_TRANSPORT_KEYWORDS = {
     "stampede", "bheed mein phas gaye", "stampede",
     # English
     "public transport", "train accident", "bus accident", "metro accident"
-}
+})
 
 # 🧠 9. MENTAL HEALTH / DISTRESS
-MENTAL_HEALTH_KEYWORDS = {
+MENTAL_HEALTH_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "suicide kar lega", "suicide", "jaan dene ki baat", "suicidal",
     "depression mein hai", "depression", "depressed",
@@ -172,10 +177,10 @@ MENTAL_HEALTH_KEYWORDS = {
     "dar lag raha hai", "fear", "scared",
     # English
     "suicide", "mental health", "depression", "distress"
-}
+})
 
 # ⚠️ 10. URGENCY / PANIC SIGNALS (Boost urgency score)
-URGENCY_KEYWORDS = {
+URGENCY_KEYWORDS = frozenset({
     # Hindi / Hinglish
     "jaldi bhejo", "jaldi", "fast", "quickly",
     "abhi", "now", "immediately", "right now",
@@ -188,10 +193,10 @@ URGENCY_KEYWORDS = {
     "please sir", "please madam", "please",
     # English
     "urgent", "emergency", "critical", "immediate", "help needed"
-}
+})
 
 # 📍 11. LOCATION / ADDRESS SIGNALS (India-Specific)
-LOCATION_INDICATORS = {
+LOCATION_INDICATORS = frozenset({
     # Landmark style
     "mandir ke paas", "temple near", "temple",
     "masjid ke saamne", "mosque", "masjid",
@@ -206,17 +211,17 @@ LOCATION_INDICATORS = {
     "hospital ke saamne", "hospital near", "hospital",
     "metro station", "metro", "railway station", "station",
     "bus stop", "bus stand"
-}
+})
 
 # 🔁 12. REPETITION / CONFUSION SIGNALS
-REPETITION_SIGNALS = {
+REPETITION_SIGNALS = frozenset({
     "wahi baat baar baar", "same thing repeating",
     "same sentence repeat", "repeating",
     "unclear words", "unclear",
     "incomplete sentences", "incomplete",
     "silence gaps", "silence",
     "crying + speaking", "crying while speaking"
-}
+})
 
 # 🌐 13. LANGUAGE / DIALECT MARKERS
 LANGUAGE_MARKERS = {
@@ -229,7 +234,7 @@ LANGUAGE_MARKERS = {
 
 
 # Complete mapping of categories to keywords
-INCIDENT_KEYWORD_MAP: Dict[IncidentCategory, Set[str]] = {
+INCIDENT_KEYWORD_MAP: Dict[IncidentCategory, FrozenSet[str]] = {
     IncidentCategory.MEDICAL_EMERGENCY: MEDICAL_KEYWORDS,
     IncidentCategory.ROAD_ACCIDENT: ROAD_ACCIDENT_KEYWORDS,
     IncidentCategory.FIRE_EMERGENCY: FIRE_KEYWORDS,
@@ -241,6 +246,56 @@ INCIDENT_KEYWORD_MAP: Dict[IncidentCategory, Set[str]] = {
     IncidentCategory.MENTAL_HEALTH: MENTAL_HEALTH_KEYWORDS,
 }
 
+# Lowercased once at import; the detectors compare against lowercased text.
+# Interned so a keyword listed under two categories ("khoon beh raha hai")
+# is one string object rather than a lowercased copy per table.
+_INCIDENT_MAP_LC: Dict[IncidentCategory, FrozenSet[str]] = {
+    category: frozenset(sys.intern(keyword.lower()) for keyword in keywords)
+    for category, keywords in INCIDENT_KEYWORD_MAP.items()
+}
+_URGENCY_LC = frozenset(sys.intern(keyword.lower()) for keyword in URGENCY_KEYWORDS)
+_REPETITION_LC = frozenset(sys.intern(keyword.lower()) for keyword in REPETITION_SIGNALS)
+
+
+def _keyword_categories() -> Dict[str, List[IncidentCategory]]:
+    """
+    Map each lowercased incident keyword to the categories that list it.
+    
+    A few keywords (e.g. "khoon beh raha hai") belong to more than one
+    category, so one pass over the keyword hits can score every category.
+    
+    Returns:
+        dict: Lowercased keyword to categories, in INCIDENT_KEYWORD_MAP order
+    """
+    categories: Dict[str, List[IncidentCategory]] = {}
+    for category, keywords in _INCIDENT_MAP_LC.items():
+        for keyword in keywords:
+            categories.setdefault(keyword, []).append(category)
+    return categories
+
+
+_KEYWORD_CATEGORIES = _keyword_categories()
+
+# Built once at import: one pass over the text finds every keyword hit
+_INCIDENT_AUTOMATON = build_automaton(_KEYWORD_CATEGORIES)
+_URGENCY_AUTOMATON = build_automaton(_URGENCY_LC)
+_REPETITION_AUTOMATON = build_automaton(_REPETITION_LC)
+# Every incident, urgency and repetition keyword, for analyze_keyword_signals
+_SIGNAL_KEYWORDS = frozenset(_KEYWORD_CATEGORIES) | _URGENCY_LC | _REPETITION_LC
+_SIGNAL_AUTOMATON = build_automaton(_SIGNAL_KEYWORDS)
+
+# One alternation per language/dialect label, compiled once at import. The
+# markers are short words ("a", "is", "है"), so they only match whole: not
+# next to another letter or Devanagari sign (matras are not \w).
+_LANGUAGE_PATTERNS: Dict[str, re.Pattern] = {
+    label: re.compile(
+        r"(?<![\w\u0900-\u097F])(?:"
+        + "|".join(re.escape(marker.lower()) for marker in markers)
+        + r")(?![\w\u0900-\u097F])"
+    )
+    for label, markers in LANGUAGE_MARKERS.items()
+}
+
 
 def classify_incident_by_keywords(text: str) -> str:
     """
@@ -257,18 +312,34 @@ def classify_incident_by_keywords(text: str) -> str:
     if not text:
         return IncidentCategory.UNKNOWN.value
     
-    text_lower = text.lower()
+    present = present_keywords(_INCIDENT_AUTOMATON, _KEYWORD_CATEGORIES, text.lower())
+    return _category_from_keywords(present)
+
+
+def _category_from_keywords(present: set) -> str:
+    """
+    Pick the incident category with the most distinct keywords present.
     
-    # Count matches for each category
-    category_scores: Dict[IncidentCategory, int] = {}
+    Args:
+        present: Keywords found in the text (non-incident keywords are ignored)
     
-    for category, keywords in INCIDENT_KEYWORD_MAP.items():
-        score = 0
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                score += 1
-        if score > 0:
-            category_scores[category] = score
+    Returns:
+        str: Incident category value, or "unknown" if none matched
+    """
+    # Each distinct keyword counts once, however often it occurs
+    counts = Counter(
+        category
+        for keyword in present
+        for category in _KEYWORD_CATEGORIES.get(keyword, ())
+    )
+    
+    # Count matches for each category; map order keeps ties resolving to the
+    # first category in INCIDENT_KEYWORD_MAP
+    category_scores: Dict[IncidentCategory, int] = {
+        category: counts[category]
+        for category in INCIDENT_KEYWORD_MAP
+        if counts[category] > 0
+    }
     
     # Return category with highest score
     if category_scores:
@@ -292,7 +363,39 @@ def detect_urgency_signals(text: str) -> bool:
         return False
     
     text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in URGENCY_KEYWORDS)
+    if _URGENCY_AUTOMATON is not None:
+        # Stop at the first hit
+        return next(_URGENCY_AUTOMATON.iter(text_lower), None) is not None
+    return any(keyword in text_lower for keyword in _URGENCY_LC)
+
+
+# Longest urgency keyword: a match can straddle at most this many chars - 1
+# of already-scanned text when a transcript only grows
+_MAX_URGENCY_KEYWORD_LEN = max(len(keyword) for keyword in _URGENCY_LC)
+
+
+def detect_urgency_signals_incremental(text: str, previous_text: str, previous_result: bool) -> bool:
+    """
+    Detect urgency signals in text that may extend a previously scanned text.
+    
+    If text only appended to previous_text, a previous match still holds and
+    otherwise only the new suffix (plus enough overlap for a keyword spanning
+    the boundary) needs scanning. Any other change falls back to a full scan.
+    
+    Args:
+        text: User's transcribed speech
+        previous_text: Text passed on the previous call ("" if none)
+        previous_result: Result returned for previous_text
+    
+    Returns:
+        bool: True if urgency signals detected (same as detect_urgency_signals(text))
+    """
+    if previous_text and text.startswith(previous_text):
+        if previous_result:
+            return True
+        start = max(len(previous_text) - _MAX_URGENCY_KEYWORD_LEN + 1, 0)
+        return detect_urgency_signals(text[start:])
+    return detect_urgency_signals(text)
 
 
 def detect_repetition_signals(text: str) -> bool:
@@ -309,7 +412,60 @@ def detect_repetition_signals(text: str) -> bool:
         return False
     
     text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in REPETITION_SIGNALS)
+    if _REPETITION_AUTOMATON is not None:
+        # Stop at the first hit
+        return next(_REPETITION_AUTOMATON.iter(text_lower), None) is not None
+    return any(keyword in text_lower for keyword in _REPETITION_LC)
+
+
+def analyze_keyword_signals(text: str) -> Dict[str, any]:
+    """
+    Classify the incident and detect urgency and repetition signals at once.
+    
+    Equivalent to calling classify_incident_by_keywords,
+    detect_urgency_signals and detect_repetition_signals, but with a single
+    keyword scan over the text.
+    
+    Args:
+        text: User's transcribed speech
+    
+    Returns:
+        dict: JSON with keys:
+            - "category": str - Incident category (as classify_incident_by_keywords)
+            - "urgency": bool - Urgency signals detected
+            - "repetition": bool - Repetition signals detected
+    """
+    if not text:
+        return {
+            "category": IncidentCategory.UNKNOWN.value,
+            "urgency": False,
+            "repetition": False
+        }
+    
+    present = present_keywords(_SIGNAL_AUTOMATON, _SIGNAL_KEYWORDS, text.lower())
+    return {
+        "category": _category_from_keywords(present),
+        "urgency": not present.isdisjoint(_URGENCY_LC),
+        "repetition": not present.isdisjoint(_REPETITION_LC)
+    }
+
+
+def detect_language_markers(text: str) -> List[str]:
+    """
+    Detect language/dialect markers in text.
+    
+    Args:
+        text: User's transcribed speech
+    
+    Returns:
+        List[str]: LANGUAGE_MARKERS labels with at least one marker present,
+            in LANGUAGE_MARKERS order (e.g. ["pure Hindi", "local slang"])
+    """
+    if not text:
+        return []
+    
+    text_lower = text.lower()
+    return [label for label, pattern in _LANGUAGE_PATTERNS.items() if pattern.search(text_lower)]
 
 
 def get_all_keywords_for_category(category: str) -> List[str]:
@@ -13,12 +13,16 @@ Handles:
 
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Normalized texts whose intent scores are kept by _detect_intent_cached
+INTENT_CACHE_SIZE = 4096
+
 
 class Intent(Enum):
     """Intent categories for user requests."""
@@ -43,7 +47,6 @@ INTENT_KEYWORDS: Dict[Intent, Dict[str, float]] = {
         "ट्रक": 0.7,  # truck
         "मोटरसाइकिल": 0.7,  # motorcycle
         "टक्कर": 0.9,  # collision
-        "दुर्घटना": 1.0,  # accident
         "गिर गया": 0.8,  # fell down
         "गिर गई": 0.8,  # fell down (feminine)
         "टूट गया": 0.7,  # broke
@@ -254,6 +257,59 @@ INTENT_KEYWORDS: Dict[Intent, Dict[str, float]] = {
     }
 }
 
+# Intent members in definition order; scores are kept in tuples in this order
+_INTENTS: Tuple[Intent, ...] = tuple(Intent)
+
+# Splits fragmented speech on punctuation (including the danda) and spaces
+_KEYWORD_SPLIT_RE = re.compile(r'[,\s\.!?।]+')
+
+
+def _canonical_keywords(intent: Intent, weights: Dict[str, float]) -> Dict[str, float]:
+    """
+    Lowercase an intent's keywords, keeping the highest weight on collisions.
+    
+    Two keywords that differ only in case would otherwise both be scored, or
+    one would silently overwrite the other; collisions are logged once here.
+    Keywords shared between intents (e.g. "attack") are left alone: each
+    intent scores its own copy.
+    
+    Args:
+        intent: Intent the keywords belong to (for the warning)
+        weights: Mapping of keyword to weight
+    
+    Returns:
+        dict: Lowercased keyword to weight, in first-seen order
+    """
+    canonical = {}
+    for keyword, weight in weights.items():
+        key = keyword.lower()
+        if key in canonical:
+            logger.warning(
+                f"Duplicate {intent.value} keyword '{key}' "
+                f"(weights {canonical[key]} and {weight}); keeping the higher"
+            )
+        canonical[key] = max(weight, canonical.get(key, weight))
+    return canonical
+
+
+# Lowercased keyword tables and their total weights, computed once at import
+# (text is lowercased by normalize_text before matching)
+_INTENT_KEYWORDS_LC: Dict[Intent, Dict[str, float]] = {
+    intent: _canonical_keywords(intent, keywords)
+    for intent, keywords in INTENT_KEYWORDS.items()
+}
+_MAX_INTENT_SCORES: Dict[Intent, float] = {
+    intent: sum(keywords.values())
+    for intent, keywords in _INTENT_KEYWORDS_LC.items()
+}
+# Longest keyword phrase in words ("सांस नहीं आ रही" has four), so every
+# keyword can be matched whole
+_MAX_KEYWORD_WORDS = max(
+    len(keyword.split())
+    for keywords in _INTENT_KEYWORDS_LC.values()
+    for keyword in keywords
+)
+
 
 def normalize_text(text: str) -> str:
     """
@@ -277,11 +333,9 @@ def normalize_text(text: str) -> str:
     # This handles both English and transliterated Hindi
     text = text.lower()
     
-    # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    
-    return text
+    # Remove extra whitespace and normalize: split() drops leading/trailing
+    # whitespace and collapses runs of any Unicode whitespace in one C pass
+    return ' '.join(text.split())
 
 
 def extract_keywords(text: str) -> List[str]:
@@ -302,32 +356,46 @@ def extract_keywords(text: str) -> List[str]:
     if not text:
         return []
     
-    normalized = normalize_text(text)
-    
+    return _extract_keywords_from_normalized(normalize_text(text))
+
+
+def _extract_keywords_from_normalized(normalized: str) -> List[str]:
+    """Extract keywords and phrases from text already passed through normalize_text."""
     # Split on common delimiters
     # Handles punctuation, spaces, and common separators
-    words = re.split(r'[,\s\.!?।]+', normalized)
-    
-    # Filter out empty strings
-    words = [w.strip() for w in words if w.strip()]
+    # Filter out empty strings (pieces never contain whitespace, only the
+    # ends of the split can be empty)
+    words = [w for w in _KEYWORD_SPLIT_RE.split(normalized) if w]
     
     # Also extract 2-word and 3-word phrases for better matching
     # This helps with phrases like "heart attack", "mobile चोरी"
-    phrases = []
-    if len(words) >= 2:
-        # 2-word phrases
-        for i in range(len(words) - 1):
-            phrases.append(f"{words[i]} {words[i+1]}")
-    
-    if len(words) >= 3:
-        # 3-word phrases
-        for i in range(len(words) - 2):
-            phrases.append(f"{words[i]} {words[i+1]} {words[i+2]}")
+    bigrams = [f"{a} {b}" for a, b in zip(words, words[1:])]
+    trigrams = [f"{a} {b} {c}" for a, b, c in zip(words, words[1:], words[2:])]
     
     # Combine words and phrases
-    all_keywords = words + phrases
+    return words + bigrams + trigrams
+
+
+def _keyword_spans(normalized: str) -> List[Tuple[Tuple[str, int], ...]]:
+    """
+    Candidate keyword phrases at each word position of normalized text.
+    
+    Args:
+        normalized: Output of normalize_text
     
-    return all_keywords
+    Returns:
+        List: For each word position, (phrase, word count) pairs starting
+            there, longest first, up to _MAX_KEYWORD_WORDS words
+    """
+    words = [w for w in _KEYWORD_SPLIT_RE.split(normalized) if w]
+    
+    return [
+        tuple(
+            (" ".join(words[i:i + size]), size)
+            for size in range(min(_MAX_KEYWORD_WORDS, len(words) - i), 0, -1)
+        )
+        for i in range(len(words))
+    ]
 
 
 def calculate_intent_score(text: str, intent: Intent) -> float:
@@ -351,13 +419,28 @@ def calculate_intent_score(text: str, intent: Intent) -> float:
         return 0.0
     
     # Extract keywords from text
-    keywords = extract_keywords(text)
+    return _score_keywords(_keyword_spans(normalize_text(text)), intent)
+
+
+def _score_keywords(spans: List[Tuple[Tuple[str, int], ...]], intent: Intent) -> float:
+    """
+    Score already-extracted keyword spans against one intent.
+    
+    detect_intent extracts spans once and scores every intent from them;
+    calculate_intent_score extracts them for a single intent.
+    
+    Args:
+        spans: Output of _keyword_spans
+        intent: Intent category to score
     
-    if not keywords:
+    Returns:
+        float: Confidence score (0.0 to 1.0)
+    """
+    if not spans:
         return 0.0
     
     # Get keyword dictionary for this intent
-    intent_keywords = INTENT_KEYWORDS.get(intent, {})
+    intent_keywords = _INTENT_KEYWORDS_LC.get(intent, {})
     
     if not intent_keywords:
         return 0.0
@@ -367,33 +450,30 @@ def calculate_intent_score(text: str, intent: Intent) -> float:
     total_score = 0.0
     matches_found = 0
     
-    for keyword in keywords:
-        # Check for exact match (case-insensitive)
-        keyword_lower = keyword.lower()
-        
-        # Check all intent keywords for matches
-        for intent_keyword, weight in intent_keywords.items():
-            intent_keyword_lower = intent_keyword.lower()
-            
-            # Exact match
-            if keyword_lower == intent_keyword_lower:
+    # Only whole words and phrases count: a fragment inside a longer word
+    # ("car" in "scared", "how" in "shower") is not evidence for an intent.
+    # Matches are leftmost-longest: words covered by a matched phrase are
+    # skipped, so "chest pain" scores once, not also as "chest" and "pain"
+    position = 0
+    while position < len(spans):
+        for keyword, size in spans[position]:
+            weight = intent_keywords.get(keyword)
+            if weight is not None:
                 total_score += weight
-                matches_found += 1
-                logger.debug(f"Match found: '{keyword}' -> {intent.value} (weight: {weight})")
-            
-            # Partial match (keyword contains intent keyword or vice versa)
-            # This helps with fragmented speech
-            elif keyword_lower in intent_keyword_lower or intent_keyword_lower in keyword_lower:
-                # Use partial weight for partial matches
-                partial_weight = weight * 0.5
-                total_score += partial_weight
-                matches_found += 1
-                logger.debug(f"Partial match: '{keyword}' -> {intent.value} (weight: {partial_weight})")
+                # A phrase counts toward the boost once per word it covers,
+                # so it is never weaker evidence than its words alone
+                matches_found += size
+                # %-style args: formatted only if DEBUG is enabled (runs per match)
+                logger.debug("Match found: '%s' -> %s (weight: %s)", keyword, intent.value, weight)
+                position += size
+                break
+        else:
+            position += 1
     
     # Normalize score
     # Maximum possible score is sum of all weights
     # We normalize to 0.0-1.0 range
-    max_possible_score = sum(intent_keywords.values())
+    max_possible_score = _MAX_INTENT_SCORES[intent]
     
     if max_possible_score == 0:
         return 0.0
@@ -462,21 +542,7 @@ def detect_intent(text: str) -> Dict[str, any]:
     
     logger.debug(f"Detecting intent for text: {normalized_text[:100]}...")
     
-    # Calculate scores for all intent categories
-    intent_scores = {}
-    for intent in Intent:
-        score = calculate_intent_score(normalized_text, intent)
-        intent_scores[intent] = score
-    
-    # Find intent with highest score
-    best_intent = max(intent_scores.items(), key=lambda x: x[1])
-    detected_intent, confidence = best_intent
-    
-    # Convert scores to dictionary with string keys for JSON
-    scores_dict = {
-        intent.value: float(intent_scores[intent])
-        for intent in Intent
-    }
+    detected_intent, confidence, scores = _detect_intent_cached(normalized_text)
     
     # Log detection result
     logger.info(
@@ -488,10 +554,35 @@ def detect_intent(text: str) -> Dict[str, any]:
     return {
         "intent": detected_intent.value,
         "confidence": round(float(confidence), 3),  # Round to 3 decimal places
-        "scores": scores_dict  # Include all scores for debugging/analysis
+        # Convert scores to dictionary with string keys for JSON
+        "scores": {  # Include all scores for debugging/analysis
+            intent.value: score
+            for intent, score in zip(_INTENTS, scores)
+        }
     }
 
 
+@lru_cache(maxsize=INTENT_CACHE_SIZE)
+def _detect_intent_cached(normalized_text: str) -> Tuple[Intent, float, Tuple[float, ...]]:
+    """
+    Score every intent for already-normalized text (memoized).
+    
+    Args:
+        normalized_text: Non-blank output of normalize_text
+    
+    Returns:
+        Tuple: (best intent, its score, all scores in Intent order)
+    """
+    # Calculate scores for all intent categories from one keyword extraction
+    spans = _keyword_spans(normalized_text)
+    scores = tuple(_score_keywords(spans, intent) for intent in _INTENTS)
+    
+    # Find intent with highest score (the first one on ties)
+    best = max(range(len(scores)), key=scores.__getitem__)
+    
+    return _INTENTS[best], scores[best], scores
+
+
 def detect_intent_simple(text: str) -> Dict[str, any]:
     """
     Simplified intent detection (returns only intent and confidence).
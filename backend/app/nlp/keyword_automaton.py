@@ -0,0 +1,58 @@
+"""
+Shared Aho-Corasick keyword matching.
+
+Entity extraction, India keyword classification and stress estimation all
+scan text for many fixed keywords. An Aho-Corasick automaton finds every
+keyword in one pass over the text.
+
+pyahocorasick is optional: without it build_automaton returns None and
+callers fall back to one substring test per keyword.
+"""
+
+from typing import Iterable, Set
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: callers fall back to per-keyword scans
+    ahocorasick = None
+
+
+def build_automaton(keywords: Iterable[str]):
+    """
+    Build an Aho-Corasick automaton over keywords.
+    
+    Each keyword is stored as its own value, so iterating the automaton
+    yields (end_index, keyword) pairs.
+    
+    Args:
+        keywords: Keywords to match (already in the case the text will be in)
+    
+    Returns:
+        Automaton ready for matching, or None if pyahocorasick is missing
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def present_keywords(automaton, keywords: Iterable[str], text: str) -> Set[str]:
+    """
+    Return the keywords that occur anywhere in text.
+    
+    With an automaton this is a single pass over text.
+    
+    Args:
+        automaton: Automaton from build_automaton, or None
+        keywords: Keywords the automaton was built from
+        text: Text in the same case as the keywords
+    
+    Returns:
+        set: Keywords found as substrings of text
+    """
+    if automaton is None:
+        return {keyword for keyword in keywords if keyword in text}
+    return {keyword for _, keyword in automaton.iter(text)}
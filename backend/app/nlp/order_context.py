@@ -116,7 +116,7 @@ class OrderContextEngine:
         
         # Extract entities from new text
         # This uses the entities.py module to extract structured information
-        extraction_result = extract_entities(text)
+        extraction_result = extract_entities(text, copy=False)
         new_entities = extraction_result.get("entities", {})
         new_confidence = extraction_result.get("confidence", {})
         
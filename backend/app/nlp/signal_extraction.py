@@ -25,6 +25,7 @@ This response is validated and normalized before use.
 import os
 import json
 import logging
+from functools import lru_cache
 from typing import Dict, Optional, Any
 from openai import OpenAI
 from dotenv import load_dotenv
@@ -33,6 +34,21 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Streaming chunks re-send the same transcript and context; cache API results
+SIGNAL_CACHE_SIZE = 2048
+
+# Context fields shown to OpenAI: facts already established in the call.
+# Scores, confidences, emotion history and timestamps change on every
+# update, so they are left out of the prompt and of the cache key.
+_PROMPT_CONTEXT_FIELDS = (
+    "incident_type",
+    "location",
+    "caller_name",
+    "people_affected",
+    "immediate_danger",
+    "language",
+)
+
 _client: Optional[OpenAI] = None
 
 
@@ -57,6 +73,10 @@ def extract_signals(transcript: str, previous_context: Optional[Dict] = None) ->
     
     All decisions are made deterministically in our code based on these signals.
     
+    Results are cached on the transcript and the established context facts
+    (_PROMPT_CONTEXT_FIELDS), so a repeated streaming chunk does not trigger
+    another API call. Failed calls are not cached.
+    
     Args:
         transcript: User's transcribed speech (may be fragmented, emotional)
         previous_context: Optional previous context for better extraction
@@ -82,11 +102,65 @@ def extract_signals(transcript: str, previous_context: Optional[Dict] = None) ->
         }
     
     try:
-        client = get_client()
+        signals = _extract_signals_cached(transcript, _prompt_context_json(previous_context))
+        
+        # Fresh dicts the caller may mutate without touching the cached result
+        return {**signals, "entities": dict(signals["entities"])}
         
-        # Build prompt for OpenAI to extract signals only
-        # Explicitly instruct OpenAI to NOT make decisions
-        system_prompt = """You are a signal extraction system for an emergency call triage system in India.
+    except Exception as e:
+        logger.error(f"OpenAI signal extraction failed: {e}", exc_info=True)
+        # Return safe defaults on error
+        return {
+            "language": "unclear",
+            "intent": "unclear",
+            "entities": {"name": None, "location": None, "incident": None},
+            "emotion": "calm",
+            "clarity": 0.0
+        }
+
+
+def _prompt_context_json(previous_context: Optional[Dict]) -> Optional[str]:
+    """
+    Reduce previous context to the facts the prompt needs.
+    
+    Args:
+        previous_context: ConversationContext.to_dict() output, or None
+    
+    Returns:
+        Optional[str]: Canonical JSON of the _PROMPT_CONTEXT_FIELDS that are
+            set, so equal facts share a cache entry, or None if none are set
+    """
+    if not previous_context:
+        return None
+    
+    facts = {
+        field: previous_context[field]
+        for field in _PROMPT_CONTEXT_FIELDS
+        if previous_context.get(field) is not None
+    }
+    return json.dumps(facts, sort_keys=True) if facts else None
+
+
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _extract_signals_cached(transcript: str, context_json: Optional[str]) -> Dict[str, Any]:
+    """
+    Call OpenAI and validate the extracted signals (memoized).
+    
+    Exceptions propagate, so a failed call is retried next time instead of
+    being cached.
+    
+    Args:
+        transcript: Non-blank transcript
+        context_json: Output of _prompt_context_json
+    
+    Returns:
+        dict: Validated signals (shared cache entry; do not mutate)
+    """
+    client = get_client()
+    
+    # Build prompt for OpenAI to extract signals only
+    # Explicitly instruct OpenAI to NOT make decisions
+    system_prompt = """You are a signal extraction system for an emergency call triage system in India.
 
 Your ONLY job is to extract structured signals from the user's speech. You MUST NOT make any decisions.
 
@@ -99,11 +173,11 @@ Extract the following signals:
 
 Return ONLY a JSON object with these signals. Do NOT make any decisions about urgency or escalation."""
 
-        user_prompt = f"""Extract signals from this emergency call transcript:
+    user_prompt = f"""Extract signals from this emergency call transcript:
 
 "{transcript}"
 
-Previous context: {json.dumps(previous_context) if previous_context else "None"}
+Previous context: {context_json or "None"}
 
 Return a JSON object with:
 - language: "Hindi" | "Hinglish" | "English"
@@ -114,52 +188,41 @@ Return a JSON object with:
 
 Do NOT make decisions. Only extract signals."""
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Use fast, cost-effective model for signal extraction
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.2,  # Low temperature for consistent extraction
-            response_format={"type": "json_object"}  # Force JSON response
-        )
-        
-        # Parse response
-        content = response.choices[0].message.content
-        # #region agent log
-        import logging
-        logger = logging.getLogger(__name__)
-        try:
-            with open("/Users/naman/Documents/projects/Nirnay-112/.cursor/debug.log", "a") as f:
-                from datetime import datetime
-                f.write(json.dumps({"location":"signal_extraction.py:128","message":"OpenAI signal extraction response received","data":{"content_preview":content[:200],"content_length":len(content)},"timestamp":datetime.now().isoformat(),"sessionId":"debug-session","runId":"run1","hypothesisId":"D"})+"\n")
-        except: pass
-        # #endregion
-        signals = json.loads(content)
-        # #region agent log
-        try:
-            with open("/Users/naman/Documents/projects/Nirnay-112/.cursor/debug.log", "a") as f:
-                from datetime import datetime
-                f.write(json.dumps({"location":"signal_extraction.py:131","message":"Signals parsed","data":{"language":signals.get("language"),"intent":signals.get("intent"),"entities":signals.get("entities"),"emotion":signals.get("emotion"),"clarity":signals.get("clarity")},"timestamp":datetime.now().isoformat(),"sessionId":"debug-session","runId":"run1","hypothesisId":"D"})+"\n")
-        except: pass
-        # #endregion
-        
-        # Validate and normalize response
-        signals = _validate_and_normalize_signals(signals)
-        
-        logger.debug(f"Extracted signals: {signals}")
-        return signals
-        
-    except Exception as e:
-        logger.error(f"OpenAI signal extraction failed: {e}", exc_info=True)
-        # Return safe defaults on error
-        return {
-            "language": "unclear",
-            "intent": "unclear",
-            "entities": {"name": None, "location": None, "incident": None},
-            "emotion": "calm",
-            "clarity": 0.0
-        }
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",  # Use fast, cost-effective model for signal extraction
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        temperature=0.2,  # Low temperature for consistent extraction
+        response_format={"type": "json_object"}  # Force JSON response
+    )
+    
+    # Parse response
+    content = response.choices[0].message.content
+    # #region agent log
+    import logging
+    logger = logging.getLogger(__name__)
+    try:
+        with open("/Users/naman/Documents/projects/Nirnay-112/.cursor/debug.log", "a") as f:
+            from datetime import datetime
+            f.write(json.dumps({"location":"signal_extraction.py:128","message":"OpenAI signal extraction response received","data":{"content_preview":content[:200],"content_length":len(content)},"timestamp":datetime.now().isoformat(),"sessionId":"debug-session","runId":"run1","hypothesisId":"D"})+"\n")
+    except: pass
+    # #endregion
+    signals = json.loads(content)
+    # #region agent log
+    try:
+        with open("/Users/naman/Documents/projects/Nirnay-112/.cursor/debug.log", "a") as f:
+            from datetime import datetime
+            f.write(json.dumps({"location":"signal_extraction.py:131","message":"Signals parsed","data":{"language":signals.get("language"),"intent":signals.get("intent"),"entities":signals.get("entities"),"emotion":signals.get("emotion"),"clarity":signals.get("clarity")},"timestamp":datetime.now().isoformat(),"sessionId":"debug-session","runId":"run1","hypothesisId":"D"})+"\n")
+    except: pass
+    # #endregion
+    
+    # Validate and normalize response
+    signals = _validate_and_normalize_signals(signals)
+    
+    logger.debug(f"Extracted signals: {signals}")
+    return signals
 
 
 def _validate_and_normalize_signals(signals: Dict[str, Any]) -> Dict[str, Any]:
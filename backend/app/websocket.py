@@ -222,7 +222,7 @@ async def websocket_call_endpoint(websocket: WebSocket):
                             message=str(e),
                             session_id=session_id
                         )
-                        await websocket.send_json(error_response.dict())
+                        await websocket.send_json(error_response.model_dump())
                         logger.warning(f"Session {session_id}: Invalid audio - {str(e)}")
                     
                     except Exception as e:
@@ -232,7 +232,7 @@ async def websocket_call_endpoint(websocket: WebSocket):
                             message=f"Transcription failed: {str(e)}",
                             session_id=session_id
                         )
-                        await websocket.send_json(error_response.dict())
+                        await websocket.send_json(error_response.model_dump())
                         logger.error(f"Session {session_id}: Transcription error - {str(e)}")
                 
                 # Handle text messages (for control commands)